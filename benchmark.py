@@ -0,0 +1,231 @@
+"""Statistical benchmark harness shared by the exercises."""
+from __future__ import annotations
+
+import csv
+import json
+import math
+import random
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+def _random(size: int, rng: random.Random) -> list[int]:
+    return [rng.randrange(size) for _ in range(size)]
+
+
+def _few_unique(size: int, rng: random.Random) -> list[int]:
+    return [rng.randrange(8) for _ in range(size)]
+
+
+def _organ_pipe(size: int, _: random.Random) -> list[int]:
+    half = size // 2
+    return [*range(half), *range(size - half - 1, -1, -1)]
+
+
+INPUT_GENERATORS: dict[str, Callable[[int, random.Random], list[int]]] = {
+    "random": _random,
+    "sorted": lambda size, _: list(range(size)),
+    "reversed": lambda size, _: list(range(size, 0, -1)),
+    "few_unique": _few_unique,
+    "organ_pipe": _organ_pipe,
+}
+
+
+def generate_input(kind: str, size: int, seed: int = 0) -> list[int]:
+    """Generate an input list of the given kind and size."""
+    rng = random.Random(seed)  # noqa: S311 - reproducible benchmark data, not crypto
+    return INPUT_GENERATORS[kind](size, rng)
+
+
+@dataclass
+class Measurement:
+    """Timings of one algorithm on one input kind and size."""
+
+    algorithm: str
+    kind: str
+    size: int
+    times: list[float] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def median(self) -> float:
+        """Median run time, in seconds."""
+        return statistics.median(self.times) if self.times else math.nan
+
+    @property
+    def p95(self) -> float:
+        """95th percentile run time (nearest rank), in seconds."""
+        if not self.times:
+            return math.nan
+        ordered = sorted(self.times)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def as_row(self) -> dict[str, Any]:
+        """Flatten the measurement for export."""
+        row = asdict(self)
+        row.update(median=self.median, p95=self.p95, runs=len(self.times))
+        return row
+
+
+def time_call(
+    func: Callable[..., Any],
+    make_args: Callable[[], tuple],
+    warmup: int = 1,
+    repeat: int = 5,
+    ) -> tuple[Any, list[float]]:
+    """Time ``func(*make_args())`` after warmups, return the last result and timings.
+
+    ``make_args`` runs outside the timed section, so inputs can be copied
+    fresh for functions that mutate them.
+    """
+    result = None
+    for _ in range(warmup):
+        func(*make_args())
+    times = []
+    for _ in range(repeat):
+        args = make_args()
+        start = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - start)
+    return result, times
+
+
+def run_suite(  # noqa: PLR0913 - the tuning knobs are keyword-only
+    algorithms: dict[str, Callable[[list[int]], Any]],
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    kinds: Iterable[str] = tuple(INPUT_GENERATORS),
+    *,
+    warmup: int = 1,
+    repeat: int = 5,
+    seed: int = 0,
+    max_seconds: float = 10.0,
+    ) -> list[Measurement]:
+    """Benchmark every algorithm on every input kind, sizes in increasing order.
+
+    An algorithm stops growing on a kind once its median exceeds
+    ``max_seconds`` or it raises (e.g. ``RecursionError``).
+    """
+    sizes = sorted(sizes)
+    results = []
+    for kind in kinds:
+        for name, func in algorithms.items():
+            for size in sizes:
+                data = generate_input(kind, size, seed)
+                measurement = Measurement(name, kind, size)
+                results.append(measurement)
+                try:
+                    _, measurement.times = time_call(
+                        func, lambda data=data: (data[:],), warmup, repeat,
+                    )
+                except (RecursionError, MemoryError) as error:
+                    measurement.error = type(error).__name__
+                    logger.error(f"{name} ({kind}, n={size}) : {measurement.error}")
+                    break
+                logger.info(
+                    f"{name:<24} {kind:<10} n={size:<9} "
+                    f"médiane = {measurement.median:.6f}s "
+                    f"p95 = {measurement.p95:.6f}s",
+                    )
+                if measurement.median > max_seconds:
+                    break
+    return results
+
+
+def export_json(results: Sequence[Measurement], path: str | Path) -> None:
+    """Write the measurements to a JSON file."""
+    with Path(path).open("w") as file:
+        json.dump([m.as_row() for m in results], file, indent=2)
+
+
+def export_csv(results: Sequence[Measurement], path: str | Path) -> None:
+    """Write the measurements to a CSV file, one run time column per row."""
+    fields = ["algorithm", "kind", "size", "runs", "median", "p95", "error", "times"]
+    with Path(path).open("w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        for m in results:
+            row = m.as_row()
+            row["times"] = " ".join(f"{t:.9f}" for t in m.times)
+            writer.writerow(row)
+
+
+def load_json(path: str | Path) -> list[Measurement]:
+    """Read measurements back from a JSON export."""
+    with Path(path).open() as file:
+        rows = json.load(file)
+    return [
+        Measurement(r["algorithm"], r["kind"], r["size"], r["times"], r["error"])
+        for r in rows
+    ]
+
+
+def growth_exponent(results: Sequence[Measurement]) -> dict[tuple[str, str], float]:
+    """Least-squares slope of log(median) against log(size) per algorithm and kind.
+
+    About 1.0-1.2 means n log n, 2.0 means quadratic.
+    """
+    points: dict[tuple[str, str], list[tuple[float, float]]] = {}
+    for m in results:
+        if m.times and m.median > 0:
+            key = (m.algorithm, m.kind)
+            points.setdefault(key, []).append((math.log(m.size), math.log(m.median)))
+
+    slopes = {}
+    for key, xy in points.items():
+        if len(xy) < 2:  # noqa: PLR2004
+            continue
+        mean_x = statistics.fmean(x for x, _ in xy)
+        mean_y = statistics.fmean(y for _, y in xy)
+        var_x = sum((x - mean_x) ** 2 for x, _ in xy)
+        if var_x:
+            cov = sum((x - mean_x) * (y - mean_y) for x, y in xy)
+            slopes[key] = cov / var_x
+    return slopes
+
+
+def flag_regressions(
+    results: Sequence[Measurement],
+    baseline: Sequence[Measurement] = (),
+    max_exponent: float = 1.3,
+    slowdown: float = 1.25,
+    ) -> list[str]:
+    """List complexity regressions and slowdowns against an optional baseline.
+
+    A series is flagged when its growth exponent exceeds ``max_exponent`` or a
+    median is more than ``slowdown`` times the baseline median.
+    """
+    flags = [
+        f"{name} ({kind}) : croissance en n^{slope:.2f}"
+        for (name, kind), slope in growth_exponent(results).items()
+        if slope > max_exponent
+    ]
+    flags.extend(
+        f"{m.algorithm} ({m.kind}, n={m.size}) : échec ({m.error})"
+        for m in results
+        if m.error
+    )
+
+    reference = {(m.algorithm, m.kind, m.size): m for m in baseline}
+    for m in results:
+        old = reference.get((m.algorithm, m.kind, m.size))
+        if old is None or not old.times or not m.times:
+            continue
+        if m.median > slowdown * old.median:
+            flags.append(
+                f"{m.algorithm} ({m.kind}, n={m.size}) : "
+                f"{m.median / old.median:.2f}x plus lent que la référence",
+            )
+
+    for flag in flags:
+        logger.warning(flag)
+    return flags
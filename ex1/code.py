@@ -1,78 +1,179 @@
 """First exercise."""
 from __future__ import annotations
 
+from array import array
 from collections import deque
+from typing import TYPE_CHECKING
 
+from ex1.components import strongly_connected_components
 from logger import logger
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
-def dfs(
+    from graph import CSRGraph
+
+
+def iter_dfs(
     graph: dict[str, list[str]],
     start: str,
     visited: set[str] | None = None,
-    ) -> None:
-    """Depth First Search (DFS) algorithm."""
+    ) -> Iterator[tuple[str, int, str | None]]:
+    """Lazily yield ``(node, depth, parent)`` in DFS pre-order, without recursion."""
     if visited is None:
         visited = set()
+    if start in visited:
+        return
     visited.add(start)
-    logger.info(start)
-    for neighbor in graph[start]:
-        if neighbor not in visited:
-            dfs(graph, neighbor, visited)
+    yield start, 0, None
+    stack = [(start, iter(graph.get(start, [])))]
+    while stack:
+        node, neighbors = stack[-1]
+        for neighbor in neighbors:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                yield neighbor, len(stack), node
+                stack.append((neighbor, iter(graph.get(neighbor, []))))
+                break
+        else:
+            stack.pop()
+
+def iter_bfs(
+    graph: dict[str, list[str]],
+    start: str,
+    ) -> Iterator[tuple[str, int, str | None]]:
+    """Lazily yield ``(node, depth, parent)`` in BFS order."""
+    visited = {start}
+    queue = deque([(start, 0, None)])
+    while queue:
+        node, depth, parent = queue.popleft()
+        yield node, depth, parent
+        for neighbor in graph.get(node, []):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append((neighbor, depth + 1, node))
 
-def bfs(graph: dict[str, list[str]], start: str) -> None:
+def dfs(
+    graph: dict[str, list[str]],
+    start: str,
+    visited: set[str] | None = None,
+    *,
+    verbose: bool = False,
+    ) -> list[str]:
+    """Depth First Search (DFS) algorithm."""
+    order = []
+    for node, _, _ in iter_dfs(graph, start, visited):
+        if verbose:
+            logger.info(node)
+        order.append(node)
+    return order
+
+def bfs(
+    graph: dict[str, list[str]],
+    start: str,
+    *,
+    verbose: bool = False,
+    ) -> list[str]:
     """Breadth First Search (BFS) algorithm."""
+    order = []
+    for node, _, _ in iter_bfs(graph, start):
+        if verbose:
+            logger.info(f"BFS visit: {node}")
+        order.append(node)
+    return order
+
+def dfs_csr(graph: CSRGraph, start: int) -> list[int]:
+    """Run an iterative DFS over a CSR graph and return node ids in visit order."""
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.num_nodes)
+    order = []
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        if visited[node]:
+            continue
+        visited[node] = 1
+        order.append(node)
+        # Push in reverse so neighbors are expanded in adjacency order.
+        stack.extend(
+            targets[e]
+            for e in range(offsets[node + 1] - 1, offsets[node] - 1, -1)
+            if not visited[targets[e]]
+        )
+    return order
+
+def bfs_csr(graph: CSRGraph, start: int) -> list[int]:
+    """BFS over a CSR graph, returning node ids in visit order."""
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.num_nodes)
+    visited[start] = 1
+    order = array("i", [start])
+    head = 0
+    while head < len(order):
+        node = order[head]
+        head += 1
+        for e in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[e]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                order.append(neighbor)
+    return order.tolist()
+
+def find_cycle_dfs(graph: dict[str, list[str]]) -> list[str] | None:
+    """Return a directed cycle as ``[v0, ..., vk, v0]``, or None if acyclic."""
     visited = set()
-    queue = deque([start])
 
-    while queue:
-        node = queue.popleft()
-        if node not in visited:
-            logger.info(f"BFS visit: {node}")
-            visited.add(node)
-            for neighbor in graph.get(node, []):
+    for root in graph:
+        if root in visited:
+            continue
+        visited.add(root)
+        path = [root]
+        on_path = {root: 0}
+        stack = [iter(graph.get(root, []))]
+        while stack:
+            for neighbor in stack[-1]:
+                if neighbor in on_path:
+                    return [*path[on_path[neighbor]:], neighbor]
                 if neighbor not in visited:
-                    queue.append(neighbor)
+                    visited.add(neighbor)
+                    on_path[neighbor] = len(path)
+                    path.append(neighbor)
+                    stack.append(iter(graph.get(neighbor, [])))
+                    break
+            else:
+                stack.pop()
+                del on_path[path.pop()]
+
+    return None
 
 def has_cycle_dfs(graph: dict[str, list[str]]) -> bool:
     """Detect cycles in a directed graph using DFS."""
-    visited = set()
-    rec_stack = set()
-
-    def dfs_cycle(node: str) -> bool:
-        visited.add(node)
-        rec_stack.add(node)
-
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                if dfs_cycle(neighbor):
-                    return True
-            elif neighbor in rec_stack:
-                return True
-
-        rec_stack.remove(node)
-        return False
-
-    return any(node not in visited and dfs_cycle(node) for node in graph)
+    return find_cycle_dfs(graph) is not None
 
 def connected_components_bfs(graph: dict[str, list[str]]) -> list[list[str]]:
-    """Find connected components in an undirected graph using BFS."""
+    """Find connected components using BFS, ignoring edge direction."""
+    undirected: dict[str, list[str]] = {node: [] for node in graph}
+    for node, neighbors in graph.items():
+        for neighbor in neighbors:
+            undirected[node].append(neighbor)
+            undirected.setdefault(neighbor, []).append(node)
+
     visited = set()
     components = []
 
-    for node in graph:
+    for node in undirected:
         if node not in visited:
+            visited.add(node)
             queue = deque([node])
             component = []
 
             while queue:
                 current = queue.popleft()
-                if current not in visited:
-                    visited.add(current)
-                    component.append(current)
-                    for neighbor in graph.get(current, []):
-                        if neighbor not in visited:
-                            queue.append(neighbor)
+                component.append(current)
+                for neighbor in undirected[current]:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        queue.append(neighbor)
 
             components.append(component)
 
@@ -84,16 +185,20 @@ def run(config: dict) -> None:
     if not graph:
         logger.error("Aucun graphe fourni dans la config.")
         return
-    logger.info("Parcours DFS récursif depuis A :")
-    dfs(graph, "A")
+    logger.info("Parcours DFS itératif depuis A :")
+    dfs(graph, "A", verbose=True)
     logger.info("Parcours BFS depuis A :")
-    bfs(graph, "A")
+    bfs(graph, "A", verbose=True)
     logger.info("Détection de cycles (DFS) :")
-    if has_cycle_dfs(graph):
-        logger.info("Cycle détecté dans le graphe.")
+    cycle = find_cycle_dfs(graph)
+    if cycle:
+        logger.info(f"Cycle détecté dans le graphe : {' -> '.join(cycle)}")
     else:
         logger.info("Aucun cycle détecté.")
     logger.info("Composantes connexes (BFS) : ")
     components = connected_components_bfs(graph)
     for idx, comp in enumerate(components, 1):
         logger.info(f" Composante {idx} : {comp}")
+    logger.info("Composantes fortement connexes (Tarjan) :")
+    for idx, comp in enumerate(strongly_connected_components(graph), 1):
+        logger.info(f" Composante {idx} : {comp}")
@@ -0,0 +1,149 @@
+"""Connected and strongly connected components for large graphs."""
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+
+class DisjointSet:
+    """Array-backed union-find with path halving and union by rank."""
+
+    __slots__ = ("count", "parent", "rank")
+
+    def __init__(self, size: int = 0) -> None:
+        """Initialize ``size`` singleton sets with ids ``0..size-1``."""
+        self.parent = array("q", range(size))
+        self.rank = bytearray(size)
+        self.count = size
+
+    def __len__(self) -> int:
+        """Return the number of elements."""
+        return len(self.parent)
+
+    def add(self) -> int:
+        """Add a new singleton set and return its id."""
+        x = len(self.parent)
+        self.parent.append(x)
+        self.rank.append(0)
+        self.count += 1
+        return x
+
+    def find(self, x: int) -> int:
+        """Return the representative of ``x``'s set."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets of ``a`` and ``b``, return False if already merged."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        rank = self.rank
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
+        self.count -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        """Check whether ``a`` and ``b`` are in the same set."""
+        return self.find(a) == self.find(b)
+
+    def labels(self) -> array:
+        """Return the representative of every element."""
+        return array("q", (self.find(x) for x in range(len(self.parent))))
+
+
+def label_components(size: int, edges: Iterable[tuple[int, int]]) -> array:
+    """Label the components of an integer edge stream in a single pass."""
+    dsu = DisjointSet(size)
+    for u, v in edges:
+        dsu.union(u, v)
+    return dsu.labels()
+
+
+def connected_components_stream(
+    edges: Iterable[tuple[Hashable, Hashable]],
+    nodes: Iterable[Hashable] = (),
+    ) -> list[list[Hashable]]:
+    """Group the nodes of an edge stream into (weakly) connected components.
+
+    Edges are consumed once and never stored; only the node id table and the
+    union-find arrays are kept in memory.
+    """
+    ids: dict[Hashable, int] = {}
+    dsu = DisjointSet()
+
+    def intern(node: Hashable) -> int:
+        node_id = ids.get(node)
+        if node_id is None:
+            node_id = ids[node] = dsu.add()
+        return node_id
+
+    for node in nodes:
+        intern(node)
+    for u, v in edges:
+        dsu.union(intern(u), intern(v))
+
+    groups: dict[int, list[Hashable]] = {}
+    for node, node_id in ids.items():
+        groups.setdefault(dsu.find(node_id), []).append(node)
+    return list(groups.values())
+
+
+def _pop_component(stack: list[str], on_stack: set[str], root: str) -> list[str]:
+    """Pop the members of the component rooted at ``root`` off Tarjan's stack."""
+    component = []
+    while True:
+        member = stack.pop()
+        on_stack.discard(member)
+        component.append(member)
+        if member == root:
+            return component
+
+
+def strongly_connected_components(
+    graph: dict[str, list[str]],
+    ) -> list[list[str]]:
+    """Tarjan's algorithm, iterative, components in reverse topological order."""
+    index: dict[str, int] = {}
+    low: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components = []
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.get(root, [])))]
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = low[neighbor] = len(index)
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(graph.get(neighbor, []))))
+                    break
+                if neighbor in on_stack:
+                    low[node] = min(low[node], index[neighbor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    components.append(_pop_component(stack, on_stack, node))
+
+    return components
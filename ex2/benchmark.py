@@ -0,0 +1,73 @@
+"""Benchmark of the Dijkstra priority queue backends."""
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable
+
+from ex2.code import dijkstra
+from ex2.priority_queues import (
+    BucketQueue,
+    IndexedHeap,
+    LazyHeap,
+    PairingHeap,
+    PriorityQueue,
+    select_queue,
+)
+from logger import logger
+
+
+def random_graph(
+    nodes: int,
+    average_degree: int,
+    max_weight: int,
+    seed: int = 0,
+    ) -> dict[str, list[tuple[str, int]]]:
+    """Generate a random directed graph with integer weights in ``[1, max_weight]``."""
+    rng = random.Random(seed)  # noqa: S311 - reproducible benchmark data, not crypto
+    names = [str(i) for i in range(nodes)]
+    return {
+        name: [
+            (names[rng.randrange(nodes)], rng.randint(1, max_weight))
+            for _ in range(average_degree)
+        ]
+        for name in names
+    }
+
+
+def benchmark_queues(
+    nodes: int = 2000,
+    max_weight: int = 10,
+    repeat: int = 3,
+    ) -> dict[str, dict[str, float]]:
+    """Time a full Dijkstra run with every queue on a sparse and a dense graph."""
+    graphs = {
+        "sparse": random_graph(nodes, 4, max_weight),
+        "dense": random_graph(nodes, nodes // 10, max_weight),
+    }
+    factories: dict[str, Callable[[], PriorityQueue]] = {
+        "lazy_heap": LazyHeap,
+        "indexed_heap": IndexedHeap,
+        "pairing_heap": PairingHeap,
+        "bucket_queue": lambda: BucketQueue(max_weight),
+    }
+
+    results: dict[str, dict[str, float]] = {}
+    for kind, graph in graphs.items():
+        results[kind] = {}
+        for name, factory in factories.items():
+            best = float("inf")
+            for _ in range(repeat):
+                queue = factory()
+                start = time.perf_counter()
+                dijkstra(graph, "0", queue=queue)
+                best = min(best, time.perf_counter() - start)
+            results[kind][name] = best
+            logger.info(f"{kind:<6} {name:<13} : {best:.6f} s")
+        chosen = type(select_queue(graph)).__name__
+        logger.info(f"{kind:<6} file recommandée : {chosen}")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_queues()
@@ -2,18 +2,179 @@
 from __future__ import annotations
 
 import heapq
+from typing import TYPE_CHECKING, Callable
 
+from ex2.priority_queues import LazyHeap
 from logger import logger
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ex2.priority_queues import PriorityQueue
+    from graph import CSRGraph
+
 
 def dijkstra(
     graph: dict[str, list[tuple[str, int]]],
     start: str,
+    targets: Iterable[str] | None = None,
+    queue: PriorityQueue | None = None,
     ) -> tuple[dict[str, float], dict[str, str | None]]:
-    """Dijkstra's algorithm for finding the shortest paths from a start node."""
+    """Dijkstra's algorithm for finding the shortest paths from a start node.
+
+    When ``targets`` is given, the search stops as soon as all of them are
+    settled; distances of unsettled nodes are then only upper bounds.
+    Without an explicit ``queue`` a lazy heap is used; callers running many
+    searches on one graph can pick a better queue once with ``queue_factory``.
+    """
     dist = {node: float("inf") for node in graph}
     dist[start] = 0
     parent = dict.fromkeys(graph, None)
+    remaining = None if targets is None else set(targets)
+    if queue is None:
+        queue = LazyHeap()
+
+    queue.push(start, 0)
+
+    while queue:
+        current_dist, node = queue.pop()
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
+
+        for neighbor, weight in graph[node]:
+            distance = current_dist + weight
+            if distance < dist[neighbor]:
+                dist[neighbor] = distance
+                parent[neighbor] = node
+                queue.push(neighbor, distance)
+
+    return dist, parent
+
+def shortest_path(
+    graph: dict[str, list[tuple[str, int]]],
+    start: str,
+    end: str,
+    ) -> tuple[float, list[str]]:
+    """Point-to-point Dijkstra that stops once ``end`` is settled."""
+    dist, parent = dijkstra(graph, start, targets=(end,))
+    return dist[end], reconstruct_path(parent, start, end)
+
+def astar(
+    graph: dict[str, list[tuple[str, int]]],
+    start: str,
+    end: str,
+    heuristic: Callable[[str], float],
+    ) -> tuple[float, list[str]]:
+    """Run A* search; ``heuristic`` must never overestimate the distance to ``end``.
+
+    The heuristic only needs to be admissible, not consistent: a node reached
+    again through a shorter path is pushed and expanded again.
+
+    >>> graph = {"S": [("A", 1), ("B", 1)], "A": [("C", 3)], "B": [("C", 1)],
+    ...          "C": [("T", 3)], "T": []}
+    >>> astar(graph, "S", "T", lambda node: 4 if node == "B" else 0)
+    (5, ['S', 'B', 'C', 'T'])
+    """
+    dist = {start: 0}
+    parent: dict[str, str | None] = {start: None}
+    heap = [(heuristic(start), 0, start)]
+
+    while heap:
+        _, current_dist, node = heapq.heappop(heap)
+        if current_dist > dist[node]:
+            continue  # stale entry, the node was reached more cheaply since
+        if node == end:
+            return current_dist, reconstruct_path(parent, start, end)
+
+        for neighbor, weight in graph.get(node, []):
+            distance = current_dist + weight
+            if distance < dist.get(neighbor, float("inf")):
+                dist[neighbor] = distance
+                parent[neighbor] = node
+                estimate = distance + heuristic(neighbor)
+                heapq.heappush(heap, (estimate, distance, neighbor))
+
+    return float("inf"), []
+
+def reverse_graph(
+    graph: dict[str, list[tuple[str, int]]],
+    ) -> dict[str, list[tuple[str, int]]]:
+    """Return the graph with every edge reversed."""
+    reverse: dict[str, list[tuple[str, int]]] = {node: [] for node in graph}
+    for node, edges in graph.items():
+        for neighbor, weight in edges:
+            reverse.setdefault(neighbor, []).append((node, weight))
+    return reverse
+
+def _splice_path(
+    parents: tuple[dict[str, str | None], dict[str, str | None]],
+    start: str,
+    meeting: str,
+    ) -> list[str]:
+    """Join the forward path to ``meeting`` with the backward path to the end."""
+    path = reconstruct_path(parents[0], start, meeting)
+    node = parents[1][meeting]
+    while node is not None:
+        path.append(node)
+        node = parents[1][node]
+    return path
+
+def bidirectional_dijkstra(
+    graph: dict[str, list[tuple[str, int]]],
+    start: str,
+    end: str,
+    reverse: dict[str, list[tuple[str, int]]] | None = None,
+    ) -> tuple[float, list[str]]:
+    """Bidirectional Dijkstra, pass a precomputed ``reverse`` graph for batches."""
+    if start == end:
+        return 0, [start]
+    if reverse is None:
+        reverse = reverse_graph(graph)
+
+    sides = (graph, reverse)
+    dists: tuple[dict[str, float], dict[str, float]] = ({start: 0}, {end: 0})
+    parents: tuple[dict[str, str | None], dict[str, str | None]] = (
+        {start: None},
+        {end: None},
+    )
+    settled: tuple[set[str], set[str]] = (set(), set())
+    heaps = ([(0, start)], [(0, end)])
+    best = float("inf")
+    meeting = None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        current_dist, node = heapq.heappop(heaps[side])
+        if node in settled[side]:
+            continue
+        settled[side].add(node)
+        dist, other = dists[side], dists[1 - side]
+
+        for neighbor, weight in sides[side].get(node, []):
+            distance = current_dist + weight
+            if distance < dist.get(neighbor, float("inf")):
+                dist[neighbor] = distance
+                parents[side][neighbor] = node
+                heapq.heappush(heaps[side], (distance, neighbor))
+            if neighbor in other and distance + other[neighbor] < best:
+                best = distance + other[neighbor]
+                meeting = neighbor
+
+    if meeting is None:
+        return float("inf"), []
+    return best, _splice_path(parents, start, meeting)
+
+def dijkstra_csr(graph: CSRGraph, start: int) -> tuple[list[float], list[int]]:
+    """Dijkstra's algorithm over a CSR graph, parents are ``-1`` when unset."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = graph.num_nodes
+    dist = [float("inf")] * n
+    dist[start] = 0
+    parent = [-1] * n
 
     heap = [(0, start)]
 
@@ -22,8 +183,9 @@ def dijkstra(
         if current_dist > dist[node]:
             continue
 
-        for neighbor, weight in graph[node]:
-            distance = current_dist + weight
+        for e in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[e]
+            distance = current_dist + weights[e]
             if distance < dist[neighbor]:
                 dist[neighbor] = distance
                 parent[neighbor] = node
@@ -59,3 +221,8 @@ def run(config: dict) -> None:
                 )
         else:
             logger.info(f"Aucun chemin vers {node}")
+    dist_af, path_af = bidirectional_dijkstra(graph, "A", "F")
+    logger.info(
+        f"Dijkstra bidirectionnel A -> F : {' -> '.join(path_af)} "
+        f"(distance : {dist_af})",
+        )
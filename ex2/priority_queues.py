@@ -0,0 +1,310 @@
+"""Priority queues with decrease-key for Dijkstra's algorithm."""
+from __future__ import annotations
+
+import heapq
+from functools import partial
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+DIAL_MAX_WEIGHT = 64
+DENSE_AVERAGE_DEGREE = 32
+
+
+class PriorityQueue(Protocol):
+    """Min-priority queue used by Dijkstra's algorithm."""
+
+    def __len__(self) -> int:
+        """Return the number of queued items."""
+        ...
+
+    def push(self, item: Hashable, priority: float) -> None:
+        """Insert ``item``, or lower its priority if it is already queued."""
+        ...
+
+    def pop(self) -> tuple[float, Hashable]:
+        """Remove and return the ``(priority, item)`` pair of lowest priority."""
+        ...
+
+
+class LazyHeap:
+    """``heapq`` with lazy deletion: stale entries are skipped on pop."""
+
+    __slots__ = ("best", "heap")
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self.heap: list[tuple[float, Hashable]] = []
+        self.best: dict[Hashable, float] = {}
+
+    def __len__(self) -> int:
+        """Return the number of queued items."""
+        return len(self.best)
+
+    def push(self, item: Hashable, priority: float) -> None:
+        """Insert ``item``, or lower its priority if it is already queued."""
+        if priority < self.best.get(item, float("inf")):
+            self.best[item] = priority
+            heapq.heappush(self.heap, (priority, item))
+
+    def pop(self) -> tuple[float, Hashable]:
+        """Remove and return the ``(priority, item)`` pair of lowest priority."""
+        while True:
+            priority, item = heapq.heappop(self.heap)
+            if self.best.get(item) == priority:
+                del self.best[item]
+                return priority, item
+
+
+class IndexedHeap:
+    """Binary heap with a position index, giving true decrease-key."""
+
+    __slots__ = ("items", "position", "priorities")
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self.items: list[Hashable] = []
+        self.priorities: list[float] = []
+        self.position: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of queued items."""
+        return len(self.items)
+
+    def __contains__(self, item: Hashable) -> bool:
+        """Check whether ``item`` is queued."""
+        return item in self.position
+
+    def push(self, item: Hashable, priority: float) -> None:
+        """Insert ``item``, or lower its priority if it is already queued."""
+        i = self.position.get(item)
+        if i is None:
+            i = len(self.items)
+            self.items.append(item)
+            self.priorities.append(priority)
+        elif priority < self.priorities[i]:
+            self.priorities[i] = priority
+        else:
+            return
+        self._sift_up(i, item, priority)
+
+    def decrease_key(self, item: Hashable, priority: float) -> None:
+        """Lower the priority of a queued item."""
+        self.push(item, priority)
+
+    def pop(self) -> tuple[float, Hashable]:
+        """Remove and return the ``(priority, item)`` pair of lowest priority."""
+        items, priorities = self.items, self.priorities
+        top_item, top_priority = items[0], priorities[0]
+        del self.position[top_item]
+        last_item, last_priority = items.pop(), priorities.pop()
+        if items:
+            self._sift_down(0, last_item, last_priority)
+        return top_priority, top_item
+
+    def _sift_up(self, i: int, item: Hashable, priority: float) -> None:
+        items, priorities, position = self.items, self.priorities, self.position
+        while i > 0:
+            parent = (i - 1) >> 1
+            if priorities[parent] <= priority:
+                break
+            items[i] = items[parent]
+            priorities[i] = priorities[parent]
+            position[items[i]] = i
+            i = parent
+        items[i] = item
+        priorities[i] = priority
+        position[item] = i
+
+    def _sift_down(self, i: int, item: Hashable, priority: float) -> None:
+        items, priorities, position = self.items, self.priorities, self.position
+        n = len(items)
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and priorities[child + 1] < priorities[child]:
+                child += 1
+            if priority <= priorities[child]:
+                break
+            items[i] = items[child]
+            priorities[i] = priorities[child]
+            position[items[i]] = i
+            i = child
+        items[i] = item
+        priorities[i] = priority
+        position[item] = i
+
+
+class _PairingNode:
+    """Node of a pairing heap."""
+
+    __slots__ = ("child", "item", "prev", "priority", "sibling")
+
+    def __init__(self, item: Hashable, priority: float) -> None:
+        self.item = item
+        self.priority = priority
+        self.child: _PairingNode | None = None
+        self.sibling: _PairingNode | None = None
+        # Left sibling, or parent for a first child.
+        self.prev: _PairingNode | None = None
+
+
+class PairingHeap:
+    """Pairing heap with O(1) insert and amortized O(log n) decrease-key."""
+
+    __slots__ = ("nodes", "root")
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self.root: _PairingNode | None = None
+        self.nodes: dict[Hashable, _PairingNode] = {}
+
+    def __len__(self) -> int:
+        """Return the number of queued items."""
+        return len(self.nodes)
+
+    def __contains__(self, item: Hashable) -> bool:
+        """Check whether ``item`` is queued."""
+        return item in self.nodes
+
+    def push(self, item: Hashable, priority: float) -> None:
+        """Insert ``item``, or lower its priority if it is already queued."""
+        node = self.nodes.get(item)
+        if node is None:
+            node = self.nodes[item] = _PairingNode(item, priority)
+            self.root = node if self.root is None else _meld(self.root, node)
+        elif priority < node.priority:
+            self.decrease_key(item, priority)
+
+    def decrease_key(self, item: Hashable, priority: float) -> None:
+        """Lower the priority of a queued item."""
+        node = self.nodes[item]
+        node.priority = priority
+        if node is self.root:
+            return
+        # Cut the subtree out of its sibling list and meld it with the root.
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.sibling = node.prev = None
+        self.root = _meld(self.root, node)
+
+    def pop(self) -> tuple[float, Hashable]:
+        """Remove and return the ``(priority, item)`` pair of lowest priority."""
+        root = self.root
+        del self.nodes[root.item]
+        self.root = _merge_pairs(root.child)
+        return root.priority, root.item
+
+
+def _meld(a: _PairingNode, b: _PairingNode) -> _PairingNode:
+    """Link two heap roots, the larger one becomes the first child."""
+    if b.priority < a.priority:
+        a, b = b, a
+    b.prev = a
+    b.sibling = a.child
+    if a.child is not None:
+        a.child.prev = b
+    a.child = b
+    return a
+
+
+def _merge_pairs(first: _PairingNode | None) -> _PairingNode | None:
+    """Two-pass pairing of a sibling list, done iteratively."""
+    pairs = []
+    while first is not None:
+        a, b = first, first.sibling
+        if b is None:
+            first = None
+            a.prev = a.sibling = None
+            pairs.append(a)
+            break
+        first = b.sibling
+        a.prev = a.sibling = b.prev = b.sibling = None
+        pairs.append(_meld(a, b))
+    if not pairs:
+        return None
+    root = pairs.pop()
+    while pairs:
+        root = _meld(pairs.pop(), root)
+    root.prev = None
+    return root
+
+
+class BucketQueue:
+    """Dial's circular bucket queue for small non-negative integer weights.
+
+    Popped priorities must never decrease, which holds for Dijkstra, and every
+    queued priority must stay within ``max_weight`` of the last popped one.
+    """
+
+    __slots__ = ("buckets", "current", "priorities", "size")
+
+    def __init__(self, max_weight: int) -> None:
+        """Initialize an empty queue for edge weights up to ``max_weight``."""
+        self.size = max_weight + 1
+        self.buckets: list[set[Hashable]] = [set() for _ in range(self.size)]
+        self.priorities: dict[Hashable, int] = {}
+        self.current = 0
+
+    def __len__(self) -> int:
+        """Return the number of queued items."""
+        return len(self.priorities)
+
+    def __contains__(self, item: Hashable) -> bool:
+        """Check whether ``item`` is queued."""
+        return item in self.priorities
+
+    def push(self, item: Hashable, priority: int) -> None:
+        """Insert ``item``, or lower its priority if it is already queued."""
+        old = self.priorities.get(item)
+        if old is not None:
+            if priority >= old:
+                return
+            self.buckets[old % self.size].discard(item)
+        self.priorities[item] = priority
+        self.buckets[priority % self.size].add(item)
+
+    def decrease_key(self, item: Hashable, priority: int) -> None:
+        """Lower the priority of a queued item."""
+        self.push(item, priority)
+
+    def pop(self) -> tuple[int, Hashable]:
+        """Remove and return the ``(priority, item)`` pair of lowest priority."""
+        if not self.priorities:
+            msg = "pop depuis une file vide"
+            raise IndexError(msg)
+        buckets, size = self.buckets, self.size
+        while not buckets[self.current % size]:
+            self.current += 1
+        item = buckets[self.current % size].pop()
+        return self.priorities.pop(item), item
+
+
+def queue_factory(
+    graph: dict[str, list[tuple[str, int]]],
+    ) -> Callable[[], PriorityQueue]:
+    """Pick a queue type from the weight type and the density of the graph.
+
+    Small integer weights use Dial's buckets, dense graphs an indexed heap so
+    the queue stays bounded by V, and sparse graphs the C-backed lazy heap.
+    The choice scans every edge, so callers running many searches on one
+    graph should make it once and call the returned factory per search.
+    """
+    weights = [weight for out in graph.values() for _, weight in out]
+    max_weight = max(weights, default=0)
+    if max_weight <= DIAL_MAX_WEIGHT and all(type(w) is int for w in weights):
+        return partial(BucketQueue, max_weight)
+    if len(weights) >= DENSE_AVERAGE_DEGREE * max(len(graph), 1):
+        return IndexedHeap
+    return LazyHeap
+
+
+def select_queue(graph: dict[str, list[tuple[str, int]]]) -> PriorityQueue:
+    """Return a new queue of the type ``queue_factory`` picks for ``graph``."""
+    return queue_factory(graph)()
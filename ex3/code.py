@@ -1,14 +1,30 @@
 """Third exercise."""
 from __future__ import annotations
 
+from collections import deque
+
+from graph import CSRGraph
 from logger import logger
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
 
-def bellman_ford(
+
+def bellman_ford_with_cycle(
     graph: dict[str, list[tuple[str, int]]],
     start: str,
-    ) -> tuple[dict[str, float] | None, dict[str, str | None] | None]:
-    """Bellman-Ford algorithm for finding the shortest paths from a start node."""
+    ) -> tuple[
+        dict[str, float] | None,
+        dict[str, str | None] | None,
+        list[str] | None,
+    ]:
+    """Bellman-Ford returning ``(dist, parent, cycle)``.
+
+    ``cycle`` is None when there is no negative cycle reachable from ``start``;
+    otherwise dist and parent are None and ``cycle`` is ``[v0, ..., vk, v0]``.
+    """
     dist = {node: float("inf") for node in graph}
     dist[start] = 0
     parent = dict.fromkeys(graph, None)
@@ -29,11 +45,152 @@ def bellman_ford(
     for u in nodes:
         for v, w in graph[u]:
             if dist[u] + w < dist[v]:
+                parent[v] = u
+                return None, None, extract_cycle(parent, v, len(nodes))
+
+    return dist, parent, None
+
+
+def bellman_ford(
+    graph: dict[str, list[tuple[str, int]]],
+    start: str,
+    ) -> tuple[dict[str, float] | None, dict[str, str | None] | None]:
+    """Bellman-Ford algorithm for finding the shortest paths from a start node."""
+    dist, parent, _ = bellman_ford_with_cycle(graph, start)
+    return dist, parent
+
+
+def extract_cycle(
+    parent: dict[str, str | None],
+    node: str,
+    steps: int,
+    ) -> list[str]:
+    """Return the cycle of the parent map reached by walking back from ``node``.
+
+    ``steps`` must be at least the number of nodes so the walk ends on the cycle.
+    """
+    for _ in range(steps):
+        node = parent[node]
+    cycle = [node]
+    current = parent[node]
+    while current != node:
+        cycle.append(current)
+        current = parent[current]
+    cycle.append(node)
+    cycle.reverse()
+    return cycle
+
+
+def bellman_ford_csr(
+    graph: CSRGraph,
+    start: int,
+    ) -> tuple[list[float] | None, list[int] | None]:
+    """Bellman-Ford over a CSR graph, parents are ``-1`` when unset."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = graph.num_nodes
+    dist = [float("inf")] * n
+    dist[start] = 0
+    parent = [-1] * n
+
+    for _ in range(n - 1):
+        updated = False
+        for u in range(n):
+            du = dist[u]
+            if du == float("inf"):
+                continue
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                if du + weights[e] < dist[v]:
+                    dist[v] = du + weights[e]
+                    parent[v] = u
+                    updated = True
+        if not updated:
+            break
+
+    for u in range(n):
+        for e in range(offsets[u], offsets[u + 1]):
+            if dist[u] + weights[e] < dist[targets[e]]:
                 return None, None
 
     return dist, parent
 
 
+def spfa(
+    graph: dict[str, list[tuple[str, int]]],
+    start: str,
+    ) -> tuple[dict[str, float] | None, dict[str, str | None] | None]:
+    """Queue-based Bellman-Ford (SPFA), only relaxing edges of improved nodes.
+
+    A negative cycle is reported once some shortest path would need ``V`` or
+    more edges.
+    """
+    dist = {node: float("inf") for node in graph}
+    dist[start] = 0
+    parent = dict.fromkeys(graph, None)
+    edges_on_path = dict.fromkeys(graph, 0)
+    n = len(graph)
+
+    queue = deque([start])
+    in_queue = {start}
+
+    while queue:
+        u = queue.popleft()
+        in_queue.discard(u)
+        du = dist[u]
+        for v, w in graph[u]:
+            if du + w < dist[v]:
+                dist[v] = du + w
+                parent[v] = u
+                edges_on_path[v] = edges_on_path[u] + 1
+                if edges_on_path[v] >= n:
+                    return None, None
+                if v not in in_queue:
+                    in_queue.add(v)
+                    queue.append(v)
+
+    return dist, parent
+
+
+def bellman_ford_numpy(
+    graph: dict[str, list[tuple[str, int]]],
+    start: str,
+    ) -> tuple[dict[str, float] | None, dict[str, str | None] | None]:
+    """Bellman-Ford with every relaxation round vectorized over an edge array."""
+    if np is None:
+        msg = "NumPy est requis pour bellman_ford_numpy()."
+        raise ImportError(msg)
+    csr = CSRGraph.from_weighted(graph)
+    buffers = csr.to_numpy()
+    n = csr.num_nodes
+    sources = np.repeat(np.arange(n), np.diff(buffers["offsets"]))
+    targets = buffers["targets"]
+    weights = buffers["weights"]
+
+    dist = np.full(n, np.inf)
+    dist[csr.node_id(start)] = 0
+    parent = np.full(n, -1)
+
+    for _ in range(n):
+        candidates = dist[sources] + weights
+        new_dist = dist.copy()
+        np.minimum.at(new_dist, targets, candidates)
+        improved = new_dist < dist
+        if not improved.any():
+            break
+        winners = improved[targets] & (candidates == new_dist[targets])
+        parent[targets[winners]] = sources[winners]
+        dist = new_dist
+    else:
+        return None, None
+
+    dist_map = {name: float(d) for name, d in zip(csr.names, dist, strict=True)}
+    parent_map = {
+        name: None if p < 0 else csr.names[p]
+        for name, p in zip(csr.names, parent, strict=True)
+    }
+    return dist_map, parent_map
+
+
 def reconstruct_path(parent: dict[str, str | None], start: str, end: str) -> list[str]:
     """Reconstruct the shortest path from start to end using the parent map."""
     path = []
@@ -57,9 +214,11 @@ def run(config: dict) -> None:
     start_node = "A"
     logger.info(f"Bellman-Ford depuis {start_node} :")
 
-    dist, parent = bellman_ford(graph, start_node)
-    if dist is None:
-        logger.error("Cycle de poids négatif détecté dans le graphe !")
+    dist, parent, cycle = bellman_ford_with_cycle(graph, start_node)
+    if cycle is not None:
+        logger.error(
+            f"Cycle de poids négatif détecté dans le graphe : {' -> '.join(cycle)}",
+            )
         return
 
     if parent is None:
@@ -0,0 +1,101 @@
+"""Johnson's algorithm for all-pairs shortest paths with negative weights."""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from ex2.code import dijkstra
+from ex2.priority_queues import LazyHeap, queue_factory
+from ex3.code import bellman_ford_with_cycle
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ex2.priority_queues import PriorityQueue
+
+_VIRTUAL_SOURCE = ("johnson", "source")
+
+_worker_graph: dict[str, list[tuple[str, float]]] = {}
+_worker_queue: Callable[[], PriorityQueue] = LazyHeap
+
+
+def _init_worker(graph: dict[str, list[tuple[str, float]]]) -> None:
+    """Store the reweighted graph and its queue type once per worker process."""
+    global _worker_graph, _worker_queue  # noqa: PLW0603
+    _worker_graph = graph
+    _worker_queue = queue_factory(graph)
+
+
+def _dijkstra_from(source: str) -> tuple[str, dict[str, float]]:
+    """Run Dijkstra on the worker's reweighted graph."""
+    dist, _ = dijkstra(_worker_graph, source, queue=_worker_queue())
+    return source, dist
+
+
+def reweight(
+    graph: dict[str, list[tuple[str, int]]],
+    ) -> tuple[
+        dict[str, list[tuple[str, float]]] | None,
+        dict[str, float],
+        list[str] | None,
+    ]:
+    """Compute Johnson's potentials and the non-negative reweighted graph.
+
+    Returns ``(reweighted, potential, cycle)``; on a negative cycle the
+    reweighted graph is None and ``cycle`` holds the offending nodes.
+    """
+    nodes = dict.fromkeys(graph)
+    for edges in graph.values():
+        nodes.update(dict.fromkeys(v for v, _ in edges))
+    augmented = {node: list(graph.get(node, [])) for node in nodes}
+    augmented[_VIRTUAL_SOURCE] = [(node, 0) for node in nodes]
+
+    potential, _, cycle = bellman_ford_with_cycle(augmented, _VIRTUAL_SOURCE)
+    if potential is None:
+        return None, {}, cycle
+
+    del potential[_VIRTUAL_SOURCE]
+    reweighted = {
+        u: [(v, w + potential[u] - potential[v]) for v, w in graph.get(u, [])]
+        for u in nodes
+    }
+    return reweighted, potential, None
+
+
+def johnson(
+    graph: dict[str, list[tuple[str, int]]],
+    max_workers: int | None = None,
+    ) -> tuple[dict[str, dict[str, float]] | None, list[str] | None]:
+    """All-pairs shortest paths, returning ``(distances, negative_cycle)``.
+
+    Bellman-Ford runs once to reweight the graph, then one Dijkstra per source
+    is spread over a process pool; ``max_workers=1`` stays in-process.
+    """
+    reweighted, potential, cycle = reweight(graph)
+    if reweighted is None:
+        return None, cycle
+
+    if max_workers == 1:
+        _init_worker(reweighted)
+        results = map(_dijkstra_from, reweighted)
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(reweighted) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(reweighted,),
+        ) as executor:
+            results = list(
+                executor.map(_dijkstra_from, reweighted, chunksize=chunksize),
+            )
+
+    distances = {}
+    for source, dist in results:
+        hu = potential[source]
+        distances[source] = {
+            target: d - hu + potential[target] if d != float("inf") else d
+            for target, d in dist.items()
+        }
+    return distances, None
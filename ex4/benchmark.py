@@ -0,0 +1,80 @@
+"""Benchmark of the max-flow solvers."""
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable
+
+from ex4.code import dinic, edmonds_karp, ford_fulkerson, push_relabel
+from logger import logger
+
+
+def random_network(
+    nodes: int,
+    average_degree: int,
+    max_capacity: int,
+    seed: int = 0,
+    ) -> dict[str, dict[str, int]]:
+    """Generate a random capacity graph, source ``"0"`` and sink ``str(nodes - 1)``."""
+    rng = random.Random(seed)  # noqa: S311 - reproducible benchmark data, not crypto
+    graph: dict[str, dict[str, int]] = {str(i): {} for i in range(nodes)}
+    for u in range(nodes):
+        for _ in range(average_degree):
+            v = rng.randrange(nodes)
+            if v != u:
+                graph[str(u)][str(v)] = rng.randint(1, max_capacity)
+    return graph
+
+
+def layered_network(
+    layers: int,
+    width: int,
+    max_capacity: int,
+    seed: int = 0,
+    ) -> dict[str, dict[str, int]]:
+    """Generate a fully connected layered network, the worst case for long paths."""
+    rng = random.Random(seed)  # noqa: S311 - reproducible benchmark data, not crypto
+    names = [[f"{i}_{j}" for j in range(width)] for i in range(layers)]
+    graph: dict[str, dict[str, int]] = {
+        "0": dict.fromkeys(names[0], max_capacity * width),
+        "sink": {},
+    }
+    for i in range(layers):
+        for u in names[i]:
+            if i + 1 < layers:
+                graph[u] = {v: rng.randint(1, max_capacity) for v in names[i + 1]}
+            else:
+                graph[u] = {"sink": max_capacity * width}
+    return graph
+
+
+def benchmark_solvers(repeat: int = 3) -> dict[str, dict[str, float]]:
+    """Time every solver on sparse, dense and layered networks."""
+    cases = {
+        "sparse": (random_network(1000, 3, 100), "0", "999"),
+        "dense": (random_network(150, 60, 100), "0", "149"),
+        "layered": (layered_network(12, 12, 100), "0", "sink"),
+    }
+    solvers: dict[str, Callable[[dict, str, str], int]] = {
+        "ford_fulkerson": ford_fulkerson,
+        "edmonds_karp": edmonds_karp,
+        "dinic": dinic,
+        "push_relabel": push_relabel,
+    }
+
+    results: dict[str, dict[str, float]] = {}
+    for kind, (graph, source, sink) in cases.items():
+        results[kind] = {}
+        for name, solver in solvers.items():
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                flow = solver(graph, source, sink)
+                best = min(best, time.perf_counter() - start)
+            results[kind][name] = best
+            logger.info(f"{kind:<7} {name:<14} : {best:.6f} s (flux = {flow})")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_solvers()
@@ -1,97 +1,64 @@
 """Fourth exercise."""
 from __future__ import annotations
 
-from collections import deque
-from copy import deepcopy
+from typing import TYPE_CHECKING
 
+from ex4.residual import ResidualNetwork
+from ex4.solvers import dinic_network, push_relabel_network
 from logger import logger
 
+if TYPE_CHECKING:
+    from graph import CSRGraph
+
 
 def ford_fulkerson(
     capacity_graph: dict[str, dict[str, int]],
     source: str,
     sink: str,
+    *,
+    verbose: bool = False,
     ) -> int:
     """Ford-Fulkerson algorithm using DFS to find the maximum flow in a flow network."""
-    graph = deepcopy(capacity_graph)
-    max_flow = 0
-
-    def dfs(
-        path: list[tuple[str, str]],
-        visited: set[str],
-        node: str,
-        ) -> list[tuple[str, str]] | None:
-        if node == sink:
-            return path
-        visited.add(node)
-        for neighbor in graph.get(node, {}):
-            if neighbor not in visited and graph[node][neighbor] > 0:
-                res = dfs([*path, (node, neighbor)], visited, neighbor)
-                if res:
-                    return res
-        return None
-
-    while True:
-        visited = set()
-        path = dfs([], visited, source)
-        if not path:
-            break
-        flow = min(graph[u][v] for u, v in path)
-        for u, v in path:
-            graph[u][v] -= flow
-            graph[v].setdefault(u, 0)
-            graph[v][u] += flow
-        max_flow += flow
-        logger.info(f"Chemin trouvé : {path} avec flux = {flow}")
-
-    return max_flow
+    network = ResidualNetwork.from_capacity(capacity_graph)
+    return network.max_flow(source, sink, "dfs", verbose=verbose)
 
 
 def edmonds_karp(
     capacity_graph: dict[str, dict[str, int]],
     source: str,
     sink: str,
+    *,
+    verbose: bool = False,
     ) -> int:
     """Edmonds-Karp algorithm using BFS to find the maximum flow in a flow network."""
-    graph = deepcopy(capacity_graph)
-    max_flow = 0
-
-    while True:
-        parent = {}
-        visited = set()
-        queue = deque([source])
-        visited.add(source)
-
-        while queue:
-            u = queue.popleft()
-            for v in graph.get(u, {}):
-                if v not in visited and graph[u][v] > 0:
-                    visited.add(v)
-                    parent[v] = u
-                    queue.append(v)
-                    if v == sink:
-                        break
-
-        if sink not in parent:
-            break
-
-        path = []
-        v = sink
-        while v != source:
-            u = parent[v]
-            path.append((u, v))
-            v = u
-        path.reverse()
-
-        flow = min(graph[u][v] for u, v in path)
-        for u, v in path:
-            graph[u][v] -= flow
-            graph[v].setdefault(u, 0)
-            graph[v][u] += flow
-        max_flow += flow
-        logger.info(f"Chemin trouvé : {path} avec flux = {flow}")
-
-    return max_flow
+    network = ResidualNetwork.from_capacity(capacity_graph)
+    return network.max_flow(source, sink, "bfs", verbose=verbose)
+
+
+def dinic(
+    capacity_graph: dict[str, dict[str, int]],
+    source: str,
+    sink: str,
+    ) -> int:
+    """Dinic's algorithm (level graph + blocking flow) for the maximum flow."""
+    network = ResidualNetwork.from_capacity(capacity_graph)
+    return dinic_network(network, network.index[source], network.index[sink])
+
+
+def push_relabel(
+    capacity_graph: dict[str, dict[str, int]],
+    source: str,
+    sink: str,
+    ) -> int:
+    """Highest-label push-relabel algorithm for the maximum flow."""
+    network = ResidualNetwork.from_capacity(capacity_graph)
+    return push_relabel_network(network, network.index[source], network.index[sink])
+
+
+def edmonds_karp_csr(graph: CSRGraph, source: int, sink: int) -> int:
+    """Edmonds-Karp over the capacities of a CSR graph."""
+    network = ResidualNetwork.from_csr(graph)
+    return network.max_flow(graph.names[source], graph.names[sink])
 
 
 def run(config: dict) -> None:
@@ -102,9 +69,15 @@ def run(config: dict) -> None:
         return
 
     logger.info("Algorithme de Ford-Fulkerson (DFS) :")
-    flow_ff = ford_fulkerson(graph, "A", "F")
+    flow_ff = ford_fulkerson(graph, "A", "F", verbose=True)
     logger.info(f"Flux maximal (Ford-Fulkerson) : {flow_ff}")
 
     logger.info("Algorithme de Edmonds-Karp (BFS)")
-    flow_ek = edmonds_karp(graph, "A", "F")
+    network = ResidualNetwork.from_capacity(graph)
+    flow_ek = network.max_flow("A", "F", verbose=True)
     logger.info(f"Flux maximal (Edmonds-Karp) : {flow_ek}")
+    _, cut = network.min_cut("A")
+    logger.info(f"Coupe minimale : {cut}")
+
+    logger.info(f"Flux maximal (Dinic) : {dinic(graph, 'A', 'F')}")
+    logger.info(f"Flux maximal (Push-relabel) : {push_relabel(graph, 'A', 'F')}")
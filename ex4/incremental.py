@@ -0,0 +1,101 @@
+"""Incremental maximum flow under capacity and topology changes."""
+from __future__ import annotations
+
+from ex4.residual import ResidualNetwork
+
+
+class IncrementalMaxFlow:
+    """Maximum flow kept up to date as edges are added, removed or resized.
+
+    The residual network survives between updates. A capacity increase only
+    needs new augmenting paths, and a decrease first reroutes the displaced
+    flow around the edge, then cancels what cannot be rerouted.
+    """
+
+    def __init__(
+        self,
+        capacity_graph: dict[str, dict[str, int]],
+        source: str,
+        sink: str,
+        ) -> None:
+        """Build the residual network and solve the initial max-flow."""
+        self.network = ResidualNetwork(capacity_graph)
+        self.edges: dict[tuple[str, str], int] = {}
+        for u, out in capacity_graph.items():
+            for v, c in out.items():
+                self.edges[u, v] = self.network.add_edge(u, v, c)
+        self.network.add_node(source)
+        self.network.add_node(sink)
+        self.source = source
+        self.sink = sink
+        self.value = self.network.max_flow(source, sink)
+
+    def capacity(self, u: str, v: str) -> int:
+        """Return the current capacity of ``u -> v``."""
+        edge = self.edges.get((u, v))
+        return 0 if edge is None else self.network.capacity[edge]
+
+    def flow(self, u: str, v: str) -> int:
+        """Return the flow currently sent through ``u -> v``."""
+        edge = self.edges.get((u, v))
+        return 0 if edge is None else self.network.edge_flow(edge)
+
+    def set_capacity(self, u: str, v: str, capacity: int) -> int:
+        """Change (or create) the capacity of ``u -> v`` and return the new max-flow."""
+        network = self.network
+        edge = self.edges.get((u, v))
+        if edge is None:
+            edge = self.edges[u, v] = network.add_edge(u, v, 0)
+
+        flow = network.edge_flow(edge)
+        network.capacity[edge] = capacity
+        if capacity >= flow:
+            network.residual[edge] = capacity - flow
+        else:
+            overflow = flow - capacity
+            network.residual[edge] = 0
+            network.residual[edge ^ 1] = capacity
+            a, b = network.index[u], network.index[v]
+            s, t = network.index[self.source], network.index[self.sink]
+            # u now receives more than it sends and v the opposite: reroute
+            # u -> v first, then cancel the rest back to the source and from
+            # the sink.
+            overflow -= self._push(a, b, overflow)
+            if overflow:
+                self._push(a, s, overflow)
+                self._push(t, b, overflow)
+                self.value -= overflow
+
+        self.value += network.max_flow(self.source, self.sink)
+        return self.value
+
+    def add_edge(self, u: str, v: str, capacity: int) -> int:
+        """Insert ``u -> v``, or add to its capacity, and return the new max-flow."""
+        return self.set_capacity(u, v, self.capacity(u, v) + capacity)
+
+    def remove_edge(self, u: str, v: str) -> int:
+        """Remove ``u -> v`` and return the new max-flow."""
+        if (u, v) not in self.edges:
+            msg = f"Arête inexistante : {u} -> {v}"
+            raise KeyError(msg)
+        return self.set_capacity(u, v, 0)
+
+    def min_cut(self) -> tuple[set[str], list[tuple[str, str]]]:
+        """Return the source side of the min-cut and the saturated cut edges."""
+        side, cut = self.network.min_cut(self.source)
+        return side, [(u, v) for u, v in cut if self.capacity(u, v) > 0]
+
+    def _push(self, a: int, b: int, amount: int) -> int:
+        """Send up to ``amount`` units from ``a`` to ``b``, return what was sent."""
+        if a == b:
+            return amount
+        network = self.network
+        residual = network.residual
+        sent = 0
+        while sent < amount and (path := network.bfs_path(a, b)) is not None:
+            flow = min(amount - sent, *(residual[e] for e in path))
+            for e in path:
+                residual[e] -= flow
+                residual[e ^ 1] += flow
+            sent += flow
+        return sent
@@ -0,0 +1,229 @@
+"""Array-backed residual network shared by the max-flow algorithms."""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING
+
+from logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from graph import CSRGraph
+
+
+class ResidualNetwork:
+    """Residual graph with paired forward/reverse edges.
+
+    Edge ``2k`` is the k-th inserted edge and ``2k + 1`` its reverse, so
+    ``e ^ 1`` is always the paired edge. Out-edges of a node form a linked
+    list through ``head`` and ``next_edge``, kept in insertion order.
+    """
+
+    __slots__ = (
+        "capacity",
+        "head",
+        "index",
+        "names",
+        "next_edge",
+        "residual",
+        "tail",
+        "to",
+    )
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """Initialize a network without edges over the given nodes."""
+        self.names: list[str] = []
+        self.index: dict[str, int] = {}
+        self.head = array("q")
+        self.tail = array("q")
+        self.next_edge = array("q")
+        self.to = array("q")
+        self.residual = array("q")
+        self.capacity = array("q")
+        for name in names:
+            self.add_node(name)
+
+    @classmethod
+    def from_capacity(cls, graph: Mapping[str, Mapping[str, int]]) -> ResidualNetwork:
+        """Build a network from a ``{node: {neighbor: capacity}}`` mapping."""
+        network = cls(graph)
+        for u, out in graph.items():
+            for v, c in out.items():
+                network.add_edge(u, v, c)
+        return network
+
+    @classmethod
+    def from_csr(cls, graph: CSRGraph) -> ResidualNetwork:
+        """Build a network from the capacities of a CSR graph."""
+        network = cls(graph.names)
+        for u in range(graph.num_nodes):
+            for e in graph.out_edges(u):
+                network.add_edge_id(u, graph.targets[e], graph.capacities[e])
+        return network
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes in the network."""
+        return len(self.names)
+
+    def add_node(self, name: str) -> int:
+        """Add a node if needed and return its id."""
+        node = self.index.get(name)
+        if node is None:
+            node = self.index[name] = len(self.names)
+            self.names.append(name)
+            self.head.append(-1)
+            self.tail.append(-1)
+        return node
+
+    def add_edge(self, u: str, v: str, capacity: int) -> int:
+        """Add the edge ``u -> v`` and return its forward edge id."""
+        return self.add_edge_id(self.add_node(u), self.add_node(v), capacity)
+
+    def add_edge_id(self, u: int, v: int, capacity: int) -> int:
+        """Add the edge ``u -> v`` between node ids and return its edge id."""
+        edge = len(self.to)
+        for a, b, c in ((u, v, capacity), (v, u, 0)):
+            e = len(self.to)
+            if self.tail[a] == -1:
+                self.head[a] = e
+            else:
+                self.next_edge[self.tail[a]] = e
+            self.tail[a] = e
+            self.next_edge.append(-1)
+            self.to.append(b)
+            self.residual.append(c)
+            self.capacity.append(c)
+        return edge
+
+    def reset(self) -> None:
+        """Drop the current flow."""
+        self.residual = array("q", self.capacity)
+
+    def dfs_path(self, source: int, sink: int) -> list[int] | None:
+        """Find an augmenting path with an explicit-stack DFS."""
+        head, next_edge = self.head, self.next_edge
+        to, residual = self.to, self.residual
+        parent_edge = array("q", [-1]) * self.num_nodes
+        parent_edge[source] = -2
+        cursor = array("q", head)
+        stack = [source]
+        while stack:
+            u = stack[-1]
+            if u == sink:
+                return self._path_to(parent_edge, source, sink)
+            e = cursor[u]
+            while e != -1 and (residual[e] <= 0 or parent_edge[to[e]] != -1):
+                e = next_edge[e]
+            if e == -1:
+                cursor[u] = -1
+                stack.pop()
+                continue
+            cursor[u] = next_edge[e]
+            parent_edge[to[e]] = e
+            stack.append(to[e])
+        return None
+
+    def bfs_path(self, source: int, sink: int) -> list[int] | None:
+        """Find a shortest augmenting path with BFS."""
+        head, next_edge = self.head, self.next_edge
+        to, residual = self.to, self.residual
+        parent_edge = array("q", [-1]) * self.num_nodes
+        parent_edge[source] = -2
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            e = head[u]
+            while e != -1:
+                v = to[e]
+                if parent_edge[v] == -1 and residual[e] > 0:
+                    parent_edge[v] = e
+                    if v == sink:
+                        return self._path_to(parent_edge, source, sink)
+                    queue.append(v)
+                e = next_edge[e]
+        return None
+
+    def _path_to(self, parent_edge: array, source: int, sink: int) -> list[int]:
+        """Rebuild the edge ids of a path from the parent edge of each node."""
+        path = []
+        v = sink
+        while v != source:
+            e = parent_edge[v]
+            path.append(e)
+            v = self.to[e ^ 1]
+        path.reverse()
+        return path
+
+    def augment(self, path: list[int]) -> int:
+        """Push the bottleneck flow along ``path`` and return it."""
+        residual = self.residual
+        flow = min(residual[e] for e in path)
+        for e in path:
+            residual[e] -= flow
+            residual[e ^ 1] += flow
+        return flow
+
+    def max_flow(
+        self,
+        source: str,
+        sink: str,
+        search: str = "bfs",
+        *,
+        verbose: bool = False,
+        ) -> int:
+        """Augment from the current flow until no ``bfs``/``dfs`` path is left."""
+        s, t = self.index[source], self.index[sink]
+        find_path = self.bfs_path if search == "bfs" else self.dfs_path
+        total = 0
+        if s == t:
+            return total
+        while (path := find_path(s, t)) is not None:
+            flow = self.augment(path)
+            total += flow
+            if verbose:
+                names, to = self.names, self.to
+                edges = [(names[to[e ^ 1]], names[to[e]]) for e in path]
+                logger.info(f"Chemin trouvé : {edges} avec flux = {flow}")
+        return total
+
+    def edge_flow(self, edge: int) -> int:
+        """Return the flow on a forward edge."""
+        return self.capacity[edge] - self.residual[edge]
+
+    def edge_flows(self) -> dict[tuple[str, str], int]:
+        """Return the flow on every original edge, summed over parallel edges."""
+        flows: dict[tuple[str, str], int] = {}
+        names, to = self.names, self.to
+        for e in range(0, len(to), 2):
+            key = (names[to[e + 1]], names[to[e]])
+            flows[key] = flows.get(key, 0) + self.edge_flow(e)
+        return flows
+
+    def min_cut(self, source: str) -> tuple[set[str], list[tuple[str, str]]]:
+        """Return the source side of the min-cut and the saturated cut edges."""
+        head, next_edge = self.head, self.next_edge
+        to, residual = self.to, self.residual
+        seen = bytearray(self.num_nodes)
+        s = self.index[source]
+        seen[s] = 1
+        stack = [s]
+        while stack:
+            u = stack.pop()
+            e = head[u]
+            while e != -1:
+                if residual[e] > 0 and not seen[to[e]]:
+                    seen[to[e]] = 1
+                    stack.append(to[e])
+                e = next_edge[e]
+
+        names = self.names
+        side = {names[u] for u in range(self.num_nodes) if seen[u]}
+        cut = [
+            (names[to[e + 1]], names[to[e]])
+            for e in range(0, len(to), 2)
+            if seen[to[e + 1]] and not seen[to[e]]
+        ]
+        return side, cut
@@ -0,0 +1,254 @@
+"""Dinic and push-relabel max-flow solvers over a residual network."""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ex4.residual import ResidualNetwork
+
+
+def _levels(network: ResidualNetwork, source: int) -> array:
+    """BFS distances from ``source`` over edges with residual capacity."""
+    head, next_edge = network.head, network.next_edge
+    to, residual = network.to, network.residual
+    level = array("q", [-1]) * network.num_nodes
+    level[source] = 0
+    queue = deque([source])
+    while queue:
+        u = queue.popleft()
+        e = head[u]
+        while e != -1:
+            v = to[e]
+            if level[v] == -1 and residual[e] > 0:
+                level[v] = level[u] + 1
+                queue.append(v)
+            e = next_edge[e]
+    return level
+
+
+def _blocking_flow(
+    network: ResidualNetwork,
+    source: int,
+    sink: int,
+    level: array,
+    ) -> int:
+    """Saturate the level graph with DFS augmentations over current arcs."""
+    next_edge, to, residual = network.next_edge, network.to, network.residual
+    current = array("q", network.head)
+    total = 0
+    while True:
+        path: list[int] = []
+        u = source
+        while u != sink:
+            e = current[u]
+            while e != -1 and (residual[e] <= 0 or level[to[e]] != level[u] + 1):
+                e = next_edge[e]
+            current[u] = e
+            if e != -1:
+                path.append(e)
+                u = to[e]
+                continue
+            # Dead end: prune u from the level graph and retreat.
+            level[u] = -1
+            if not path:
+                return total
+            u = to[path.pop() ^ 1]
+            current[u] = next_edge[current[u]]
+
+        flow = min(residual[e] for e in path)
+        for e in path:
+            residual[e] -= flow
+            residual[e ^ 1] += flow
+        total += flow
+
+
+def dinic_network(network: ResidualNetwork, source: int, sink: int) -> int:
+    """Dinic's algorithm: level graphs and blocking flows with current arcs."""
+    total = 0
+    if source == sink:
+        return total
+
+    while True:
+        level = _levels(network, source)
+        if level[sink] == -1:
+            return total
+        total += _blocking_flow(network, source, sink, level)
+
+
+class _PushRelabel:
+    """State of a highest-label push-relabel run over one residual network."""
+
+    __slots__ = (
+        "active", "buckets", "count", "current", "excess", "height",
+        "highest", "max_height", "n", "network", "relabels", "sink", "source",
+    )
+
+    def __init__(self, network: ResidualNetwork, source: int, sink: int) -> None:
+        """Allocate the labels, excesses and height buckets of ``network``."""
+        self.network = network
+        self.source = source
+        self.sink = sink
+        self.n = n = network.num_nodes
+        self.max_height = 2 * n + 1
+        self.height = array("q", [0]) * n
+        self.excess = array("q", [0]) * n
+        self.current = array("q", network.head)
+        self.count = [0] * (self.max_height + 1)
+        self.buckets: list[list[int]] = [[] for _ in range(self.max_height + 1)]
+        self.active = bytearray(n)
+        self.highest = 0
+        self.relabels = 0
+
+    def activate(self, v: int) -> None:
+        """Queue ``v`` in its height bucket unless it is a terminal or queued."""
+        if not self.active[v] and v not in (self.source, self.sink):
+            self.active[v] = 1
+            height = self.height[v]
+            self.buckets[height].append(v)
+            self.highest = max(self.highest, height)
+
+    def saturate_source(self) -> None:
+        """Push the full residual capacity of every edge leaving the source."""
+        network = self.network
+        next_edge, to, residual = network.next_edge, network.to, network.residual
+        excess = self.excess
+        e = network.head[self.source]
+        while e != -1:
+            flow = residual[e]
+            if flow > 0:
+                residual[e] = 0
+                residual[e ^ 1] += flow
+                excess[to[e]] += flow
+                excess[self.source] -= flow
+            e = next_edge[e]
+
+    def global_relabel(self) -> None:
+        """Reset heights to exact residual distances to the sink, or the source."""
+        network = self.network
+        head, next_edge = network.head, network.next_edge
+        to, residual = network.to, network.residual
+        n, max_height = self.n, self.max_height
+        height, count, buckets = self.height, self.count, self.buckets
+        for h in range(max_height + 1):
+            count[h] = 0
+            buckets[h].clear()
+        for v in range(n):
+            height[v] = max_height
+            self.active[v] = 0
+        for root, base in ((self.sink, 0), (self.source, n)):
+            height[root] = base
+            queue = deque([root])
+            while queue:
+                v = queue.popleft()
+                e = head[v]
+                while e != -1:
+                    w = to[e]
+                    if height[w] == max_height and residual[e ^ 1] > 0:
+                        height[w] = height[v] + 1
+                        queue.append(w)
+                    e = next_edge[e]
+        self.highest = 0
+        for v in range(n):
+            count[height[v]] += 1
+            self.current[v] = head[v]
+            if self.excess[v] > 0:
+                self.activate(v)
+
+    def gap(self, old: int) -> None:
+        """Lift every node above the emptied height ``old`` out of the sink's reach.
+
+        Those nodes can no longer reach the sink, so they jump to ``n + 1`` and
+        only drain their excess back to the source.
+        """
+        n = self.n
+        head, height, count = self.network.head, self.height, self.count
+        for v in range(n):
+            if old < height[v] < n:
+                count[height[v]] -= 1
+                height[v] = n + 1
+                count[n + 1] += 1
+                self.current[v] = head[v]
+                if self.active[v]:
+                    self.buckets[n + 1].append(v)
+        self.highest = max(self.highest, n + 1)
+
+    def relabel(self, u: int) -> None:
+        """Lift ``u`` just above its lowest residual neighbor, applying the gap rule."""
+        network = self.network
+        head, next_edge = network.head, network.next_edge
+        to, residual = network.to, network.residual
+        height, count = self.height, self.count
+        old = height[u]
+        new = self.max_height
+        e = head[u]
+        while e != -1:
+            if residual[e] > 0:
+                new = min(new, height[to[e]] + 1)
+            e = next_edge[e]
+        count[old] -= 1
+        if count[old] == 0 and old < self.n:
+            new = max(new, self.n + 1)
+            self.gap(old)
+        height[u] = new
+        count[new] += 1
+        self.current[u] = head[u]
+
+    def discharge(self, u: int) -> None:
+        """Push the excess of ``u`` along admissible edges, relabeling at dead ends.
+
+        Every ``n`` relabels the heights are recomputed by a global relabel,
+        which requeues ``u`` if it still has excess.
+        """
+        network = self.network
+        next_edge, to, residual = network.next_edge, network.to, network.residual
+        height, excess, current = self.height, self.excess, self.current
+        while excess[u] > 0:
+            e = current[u]
+            if e == -1:
+                self.relabel(u)
+                self.relabels += 1
+                if self.relabels >= self.n:
+                    self.relabels = 0
+                    self.global_relabel()
+                    return
+                continue
+            v = to[e]
+            if residual[e] > 0 and height[u] == height[v] + 1:
+                flow = min(excess[u], residual[e])
+                residual[e] -= flow
+                residual[e ^ 1] += flow
+                excess[u] -= flow
+                excess[v] += flow
+                self.activate(v)
+            else:
+                current[u] = next_edge[e]
+
+    def run(self) -> int:
+        """Discharge the highest active node until none is left; return the flow."""
+        self.saturate_source()
+        self.global_relabel()
+        buckets, height, active = self.buckets, self.height, self.active
+        while True:
+            while self.highest >= 0 and not buckets[self.highest]:
+                self.highest -= 1
+            if self.highest < 0:
+                return self.excess[self.sink]
+            u = buckets[self.highest].pop()
+            # Entries left behind by a gap relabel point at an outdated height.
+            if not active[u] or height[u] != self.highest:
+                continue
+            active[u] = 0
+            self.discharge(u)
+
+
+def push_relabel_network(network: ResidualNetwork, source: int, sink: int) -> int:
+    """Highest-label push-relabel with gap and global relabeling heuristics.
+
+    Excess left on nodes that cannot reach the sink is pushed back to the
+    source, so the residual network holds a valid flow afterwards.
+    """
+    if source == sink:
+        return 0
+    return _PushRelabel(network, source, sink).run()
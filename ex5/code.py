@@ -1,20 +1,47 @@
 """Fifth exercise."""
-import secrets
-import time
-from typing import Callable
+from __future__ import annotations
 
+import statistics
+from typing import TYPE_CHECKING, Callable
+
+from benchmark import (
+    DEFAULT_SIZES,
+    export_csv,
+    export_json,
+    flag_regressions,
+    load_json,
+    run_suite,
+    time_call,
+)
+from ex5.introsort import introsort
+from ex5.pivots import random_pivot
 from logger import logger
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from benchmark import Measurement
+    from ex5.pivots import PivotStrategy
+
 
-def quicksort_random(arr: list[int]) -> list[int]:
-    """Quicksort algorithm with a random pivot."""
+def quicksort_random(
+    arr: list[int],
+    pivot: PivotStrategy | None = None,
+    ) -> list[int]:
+    """Quicksort algorithm with a random pivot.
+
+    ``pivot`` defaults to an unseeded ``random_pivot()``; pass a seeded
+    strategy to replay a run exactly.
+    """
+    if pivot is None:
+        pivot = random_pivot()
     if len(arr) <= 1:
         return arr
-    pivot = secrets.choice(arr)
-    less = [x for x in arr if x < pivot]
-    equal = [x for x in arr if x == pivot]
-    greater = [x for x in arr if x > pivot]
-    return quicksort_random(less) + equal + quicksort_random(greater)
+    value = pivot(arr, 0, len(arr))
+    less = [x for x in arr if x < value]
+    equal = [x for x in arr if x == value]
+    greater = [x for x in arr if x > value]
+    return quicksort_random(less, pivot) + equal + quicksort_random(greater, pivot)
 
 
 def quicksort_deterministic(arr: list[int]) -> list[int]:
@@ -26,15 +53,36 @@ def quicksort_deterministic(arr: list[int]) -> list[int]:
     greater = [x for x in arr[1:] if x >= pivot]
     return [*quicksort_deterministic(less), pivot, *quicksort_deterministic(greater)]
 
+SORTS: dict[str, Callable[[list[int]], list[int]]] = {
+    "quicksort_deterministic": quicksort_deterministic,
+    "quicksort_random": quicksort_random,
+    "introsort": introsort,
+}
+
 def measure_time(
     func: Callable[[list[int]], list[int]],
     arr: list[int],
+    repeat: int = 5,
     ) -> tuple[list[int], float]:
-    """Measure the execution time of a sorting function."""
-    start = time.perf_counter()
-    result = func(arr[:])
-    end = time.perf_counter()
-    return result, end - start
+    """Measure the median execution time of a sorting function over a few runs."""
+    result, times = time_call(func, lambda: (arr[:],), warmup=1, repeat=repeat)
+    return result, statistics.median(times)
+
+def benchmark_sorts(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    output: str | None = None,
+    baseline: str | None = None,
+    ) -> list[Measurement]:
+    """Benchmark the sorts on every input kind, export and flag regressions.
+
+    ``output`` is a ``.json`` or ``.csv`` path, ``baseline`` a JSON export.
+    """
+    results = run_suite(SORTS, sizes)
+    if output is not None:
+        export = export_csv if output.endswith(".csv") else export_json
+        export(results, output)
+    flag_regressions(results, load_json(baseline) if baseline else ())
+    return results
 
 def run(config: dict) -> None:
     """Run the quicksort algorithms."""
@@ -55,3 +103,8 @@ def run(config: dict) -> None:
         logger.info(
             f"Tri rapide randomisé : résultat = {res_rand}, temps = {time_rand:.6f}s",
             )
+
+        res_intro, time_intro = measure_time(introsort, arr)
+        logger.info(
+            f"Introsort en place : résultat = {res_intro}, temps = {time_intro:.6f}s",
+            )
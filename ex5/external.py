@@ -0,0 +1,144 @@
+"""External-memory sort for integer files larger than RAM."""
+from __future__ import annotations
+
+import contextlib
+import heapq
+import mmap
+import tempfile
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ex5.introsort import introsort
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+CHUNK_SIZE = 1_000_000
+MAX_FAN_IN = 64
+READ_BLOCK = 8192
+WRITE_BLOCK = 65536
+ITEM_SIZE = array("q").itemsize
+
+
+def _read_chunks(path: Path, chunk_size: int, *, text: bool) -> Iterator[array]:
+    """Yield the input as arrays of at most ``chunk_size`` 64-bit integers."""
+    if text:
+        with path.open() as file:
+            chunk = array("q")
+            for line in file:
+                for token in line.split():
+                    chunk.append(int(token))
+                    if len(chunk) >= chunk_size:
+                        yield chunk
+                        chunk = array("q")
+            if chunk:
+                yield chunk
+        return
+
+    with path.open("rb") as file:
+        while True:
+            chunk = array("q")
+            # fromfile keeps the items it could read before the end.
+            with contextlib.suppress(EOFError):
+                chunk.fromfile(file, chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _read_run(path: Path) -> Iterator[int]:
+    """Stream a binary run through an ``mmap``, one block at a time."""
+    if path.stat().st_size == 0:
+        return
+    with (
+        path.open("rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        view = memoryview(mm).cast("q")
+        try:
+            for start in range(0, len(view), READ_BLOCK):
+                yield from view[start:start + READ_BLOCK].tolist()
+        finally:
+            view.release()
+
+
+def _write_binary(values: Iterable[int], path: Path) -> None:
+    """Write integers to a binary file in fixed-size blocks."""
+    with path.open("wb") as file:
+        block = array("q")
+        for value in values:
+            block.append(value)
+            if len(block) >= WRITE_BLOCK:
+                block.tofile(file)
+                block = array("q")
+        block.tofile(file)
+
+
+def _write_text(values: Iterable[int], path: Path) -> None:
+    """Write integers to a text file, one per line."""
+    with path.open("w") as file:
+        block = []
+        for value in values:
+            block.append(f"{value}\n")
+            if len(block) >= WRITE_BLOCK:
+                file.writelines(block)
+                block.clear()
+        file.writelines(block)
+
+
+def external_sort(  # noqa: PLR0913 - the tuning knobs are keyword-only
+    input_path: str | Path,
+    output_path: str | Path,
+    *,
+    chunk_size: int = CHUNK_SIZE,
+    text: bool = False,
+    max_fan_in: int = MAX_FAN_IN,
+    tmp_dir: str | Path | None = None,
+    ) -> int:
+    """Sort a file of integers with bounded memory and return how many were sorted.
+
+    Binary files hold native-endian int64 values; text files hold integers
+    separated by whitespace and are written back one per line. Chunks are
+    sorted with ``introsort`` and spilled as runs, then merged ``max_fan_in``
+    at a time until one run is left. Raises ``ValueError`` when ``max_fan_in``
+    is below 2 or a binary input is not a whole number of int64 values.
+    """
+    if max_fan_in < 2:  # noqa: PLR2004
+        msg = f"max_fan_in doit valoir au moins 2 (reçu {max_fan_in})."
+        raise ValueError(msg)
+    input_path, output_path = Path(input_path), Path(output_path)
+    if not text and input_path.stat().st_size % ITEM_SIZE:
+        msg = (
+            f"{input_path} n'est pas un fichier d'entiers 64 bits : sa taille "
+            f"n'est pas un multiple de {ITEM_SIZE} octets."
+        )
+        raise ValueError(msg)
+    count = 0
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as directory:
+        runs = []
+        for chunk in _read_chunks(input_path, chunk_size, text=text):
+            introsort(chunk)
+            run = Path(directory) / f"run_{len(runs)}.bin"
+            with run.open("wb") as file:
+                chunk.tofile(file)
+            runs.append(run)
+            count += len(chunk)
+
+        generation = 0
+        while len(runs) > max_fan_in:
+            merged = []
+            for i in range(0, len(runs), max_fan_in):
+                group = runs[i:i + max_fan_in]
+                target = Path(directory) / f"merge_{generation}_{len(merged)}.bin"
+                merged_values = heapq.merge(*(_read_run(run) for run in group))
+                _write_binary(merged_values, target)
+                for run in group:
+                    run.unlink()
+                merged.append(target)
+            runs = merged
+            generation += 1
+
+        write = _write_text if text else _write_binary
+        write(heapq.merge(*(_read_run(run) for run in runs)), output_path)
+    return count
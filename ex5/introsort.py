@@ -0,0 +1,111 @@
+"""In-place, iterative introsort for lists, arrays and NumPy buffers."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ex5.pivots import ninther
+
+if TYPE_CHECKING:
+    from collections.abc import MutableSequence
+
+    from ex5.pivots import PivotStrategy
+
+INSERTION_SORT_THRESHOLD = 16
+
+
+def insertion_sort(arr: MutableSequence[int], lo: int, hi: int) -> None:
+    """Sort ``arr[lo:hi]`` in place by insertion."""
+    for i in range(lo + 1, hi):
+        x = arr[i]
+        j = i - 1
+        while j >= lo and arr[j] > x:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = x
+
+
+def heapsort(arr: MutableSequence[int], lo: int, hi: int) -> None:
+    """Sort ``arr[lo:hi]`` in place with a binary max-heap."""
+    n = hi - lo
+
+    def sift_down(root: int, end: int) -> None:
+        x = arr[lo + root]
+        while True:
+            child = 2 * root + 1
+            if child >= end:
+                break
+            if child + 1 < end and arr[lo + child + 1] > arr[lo + child]:
+                child += 1
+            if arr[lo + child] <= x:
+                break
+            arr[lo + root] = arr[lo + child]
+            root = child
+        arr[lo + root] = x
+
+    for root in range(n // 2 - 1, -1, -1):
+        sift_down(root, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        sift_down(0, end)
+
+
+def partition3(
+    arr: MutableSequence[int],
+    lo: int,
+    hi: int,
+    pivot: int,
+    ) -> tuple[int, int]:
+    """Dutch national flag partition of ``arr[lo:hi]`` around ``pivot``.
+
+    Returns ``(lt, gt)`` such that ``arr[lo:lt] < pivot``,
+    ``arr[lt:gt] == pivot`` and ``arr[gt:hi] > pivot``.
+    """
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        x = arr[i]
+        if x < pivot:
+            arr[i] = arr[lt]
+            arr[lt] = x
+            lt += 1
+            i += 1
+        elif x > pivot:
+            gt -= 1
+            arr[i] = arr[gt]
+            arr[gt] = x
+        else:
+            i += 1
+    return lt, gt
+
+
+def introsort(
+    arr: MutableSequence[int],
+    lo: int = 0,
+    hi: int | None = None,
+    pivot: PivotStrategy = ninther,
+    ) -> MutableSequence[int]:
+    """Sort ``arr[lo:hi]`` in place and return ``arr``.
+
+    Quicksort with an explicit stack and three-way partitioning, insertion
+    sort on small slices, and heapsort once the depth exceeds ``2 log2(n)``.
+    The smaller side is always handled first, so the stack stays O(log n).
+    """
+    if hi is None:
+        hi = len(arr)
+    stack = [(lo, hi, 2 * (hi - lo).bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo > INSERTION_SORT_THRESHOLD:
+            if depth == 0:
+                heapsort(arr, lo, hi)
+                break
+            depth -= 1
+            lt, gt = partition3(arr, lo, hi, pivot(arr, lo, hi))
+            if lt - lo < hi - gt:
+                stack.append((gt, hi, depth))
+                hi = lt
+            else:
+                stack.append((lo, lt, depth))
+                lo = gt
+        else:
+            insertion_sort(arr, lo, hi)
+    return arr
@@ -0,0 +1,96 @@
+"""Parallel quicksort over a shared-memory buffer."""
+from __future__ import annotations
+
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import pairwise
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING
+
+from ex5.introsort import introsort, partition3
+from ex5.pivots import ninther
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+PARALLEL_THRESHOLD = 50_000
+ITEM_SIZE = array("q").itemsize
+
+
+def _sort_range(name: str, lo: int, hi: int) -> None:
+    """Worker: sort ``[lo, hi)`` of the shared buffer in place."""
+    shm = SharedMemory(name=name)
+    try:
+        view = shm.buf.cast("q")
+        try:
+            introsort(view, lo, hi)
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def _split(view: memoryview, parts: int) -> list[tuple[int, int]]:
+    """Partition the top levels until there are about ``parts`` ranges to sort.
+
+    Ranges equal to a pivot are already in place and are dropped.
+    """
+    ranges = [(0, len(view))]
+    target = len(view) // parts
+    done = []
+    while ranges and len(ranges) + len(done) < parts:
+        ranges.sort(key=lambda r: r[1] - r[0])
+        lo, hi = ranges.pop()
+        if hi - lo <= target:
+            done.append((lo, hi))
+            continue
+        lt, gt = partition3(view, lo, hi, ninther(view, lo, hi))
+        ranges.extend(r for r in ((lo, lt), (gt, hi)) if r[1] - r[0] > 1)
+    return done + ranges
+
+
+def parallel_quicksort(
+    arr: Sequence[int],
+    max_workers: int | None = None,
+    *,
+    merge: bool = False,
+    ) -> list[int]:
+    """Sort 64-bit integers across a process pool working on shared memory.
+
+    By default the parent partitions the top levels and workers sort the
+    resulting ranges in place. With ``merge=True`` the buffer is cut into equal
+    chunks sorted independently, then k-way merged by the parent.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(arr) < PARALLEL_THRESHOLD:
+        return introsort(list(arr))
+
+    n = len(arr)
+    shm = SharedMemory(create=True, size=n * ITEM_SIZE)
+    try:
+        view = shm.buf.cast("q")
+        try:
+            view[:] = array("q", arr)
+            if merge:
+                bounds = [n * i // workers for i in range(workers + 1)]
+                ranges = list(pairwise(bounds))
+            else:
+                ranges = _split(view, 4 * workers)
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_sort_range, shm.name, lo, hi) for lo, hi in ranges
+                ]
+                for future in futures:
+                    future.result()
+
+            if merge:
+                return list(heapq.merge(*(view[lo:hi] for lo, hi in ranges)))
+            return view.tolist()
+        finally:
+            view.release()
+    finally:
+        shm.close()
+        shm.unlink()
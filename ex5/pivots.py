@@ -0,0 +1,64 @@
+"""Pivot selection strategies for the quicksorts."""
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# A strategy returns a pivot value taken from ``arr[lo:hi]``.
+PivotStrategy = Callable[["Sequence[int]", int, int], int]
+
+NINTHER_THRESHOLD = 40
+
+
+def median_of_three(a: int, b: int, c: int) -> int:
+    """Return the median of three values."""
+    if a < b:
+        if b < c:
+            return b
+        return max(a, c)
+    if a < c:
+        return a
+    return max(b, c)
+
+
+def ninther(arr: Sequence[int], lo: int, hi: int) -> int:
+    """Pivot value: median of three on small slices, Tukey's ninther otherwise."""
+    n = hi - lo
+    mid = lo + n // 2
+    if n < NINTHER_THRESHOLD:
+        return median_of_three(arr[lo], arr[mid], arr[hi - 1])
+    step = n // 8
+    return median_of_three(
+        median_of_three(arr[lo], arr[lo + step], arr[lo + 2 * step]),
+        median_of_three(arr[mid - step], arr[mid], arr[mid + step]),
+        median_of_three(arr[hi - 1 - 2 * step], arr[hi - 1 - step], arr[hi - 1]),
+    )
+
+
+def first_pivot(arr: Sequence[int], lo: int, hi: int) -> int:  # noqa: ARG001
+    """Pivot value: the first element of the slice."""
+    return arr[lo]
+
+
+def random_pivot(seed: int | None = None) -> PivotStrategy:
+    """Uniform random pivot from a seedable Mersenne Twister."""
+    randrange = random.Random(seed).randrange  # noqa: S311 - pivots, not crypto
+
+    def choose(arr: Sequence[int], lo: int, hi: int) -> int:
+        return arr[randrange(lo, hi)]
+
+    return choose
+
+
+def median_of_random(k: int = 3, seed: int | None = None) -> PivotStrategy:
+    """Median of ``k`` elements sampled at random, with replacement."""
+    randrange = random.Random(seed).randrange  # noqa: S311 - pivots, not crypto
+    middle = k // 2
+
+    def choose(arr: Sequence[int], lo: int, hi: int) -> int:
+        return sorted(arr[randrange(lo, hi)] for _ in range(k))[middle]
+
+    return choose
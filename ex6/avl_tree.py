@@ -0,0 +1,562 @@
+"""Iterative AVL tree with slotted nodes, usable as a sorted map."""
+from __future__ import annotations
+
+from itertools import pairwise
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from _typeshed import SupportsRichComparison
+
+K = TypeVar("K", bound="SupportsRichComparison")
+V = TypeVar("V")
+
+
+class TreeNode(Generic[K, V]):
+    """Node of an ``AVLTree``, with its value and the size of its subtree."""
+
+    __slots__ = ("height", "key", "left", "right", "size", "value")
+
+    def __init__(self, key: K, value: V | None = None) -> None:
+        """Initialize a leaf node."""
+        self.key = key
+        self.value = value
+        self.left: TreeNode[K, V] | None = None
+        self.right: TreeNode[K, V] | None = None
+        self.height = 1
+        self.size = 1
+
+
+def _update(node: TreeNode[K, V]) -> None:
+    """Recompute the height and size of ``node`` from its children."""
+    left, right = node.left, node.right
+    lh = left.height if left else 0
+    rh = right.height if right else 0
+    node.height = 1 + max(lh, rh)
+    node.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+
+
+def _rotate_right(z: TreeNode[K, V]) -> TreeNode[K, V]:
+    """Right rotation, heights and sizes updated inline."""
+    y = z.left
+    z.left = y.right
+    y.right = z
+    _update(z)
+    _update(y)
+    return y
+
+
+def _rotate_left(z: TreeNode[K, V]) -> TreeNode[K, V]:
+    """Left rotation, heights and sizes updated inline."""
+    y = z.right
+    z.right = y.left
+    y.left = z
+    _update(z)
+    _update(y)
+    return y
+
+
+def _rebalance(node: TreeNode[K, V]) -> TreeNode[K, V]:
+    """Update the height of ``node`` and restore its balance, return the new root."""
+    left, right = node.left, node.right
+    lh = left.height if left else 0
+    rh = right.height if right else 0
+    if lh - rh > 1:
+        if (left.left.height if left.left else 0) < (
+            left.right.height if left.right else 0
+        ):
+            node.left = _rotate_left(left)
+        return _rotate_right(node)
+    if rh - lh > 1:
+        if (right.right.height if right.right else 0) < (
+            right.left.height if right.left else 0
+        ):
+            node.right = _rotate_right(right)
+        return _rotate_left(node)
+    node.height = 1 + max(lh, rh)
+    return node
+
+
+def _size(node: TreeNode[K, V] | None) -> int:
+    """Return the size of a possibly empty subtree."""
+    return node.size if node is not None else 0
+
+
+def _build(
+    entries: list[tuple[K, V | None]],
+    lo: int,
+    hi: int,
+    ) -> TreeNode[K, V] | None:
+    """Build a perfectly balanced subtree from sorted ``entries[lo:hi]``."""
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    node = TreeNode(*entries[mid])
+    node.left = _build(entries, lo, mid)
+    node.right = _build(entries, mid + 1, hi)
+    _update(node)
+    return node
+
+
+def _join(
+    left: TreeNode[K, V] | None,
+    node: TreeNode[K, V],
+    right: TreeNode[K, V] | None,
+    ) -> TreeNode[K, V]:
+    """Join ``left < node.key < right`` into one tree, reusing ``node``.
+
+    Runs in O(|height(left) - height(right)| + 1).
+    """
+    hl = left.height if left else 0
+    hr = right.height if right else 0
+    if hl > hr + 1:
+        left.right = _join(left.right, node, right)
+        _update(left)
+        return _rebalance(left)
+    if hr > hl + 1:
+        right.left = _join(left, node, right.left)
+        _update(right)
+        return _rebalance(right)
+    node.left, node.right = left, right
+    _update(node)
+    return node
+
+
+def _pop_max(node: TreeNode[K, V]) -> tuple[TreeNode[K, V] | None, TreeNode[K, V]]:
+    """Detach the maximum node, return ``(remaining tree, max node)``."""
+    if node.right is None:
+        return node.left, node
+    node.right, last = _pop_max(node.right)
+    _update(node)
+    return _rebalance(node), last
+
+
+def _join2(
+    left: TreeNode[K, V] | None,
+    right: TreeNode[K, V] | None,
+    ) -> TreeNode[K, V] | None:
+    """Concatenate two trees whose keys satisfy ``left < right``."""
+    if left is None:
+        return right
+    rest, last = _pop_max(left)
+    return _join(rest, last, right)
+
+
+def _split(
+    node: TreeNode[K, V] | None,
+    key: K,
+    ) -> tuple[TreeNode[K, V] | None, TreeNode[K, V] | None, TreeNode[K, V] | None]:
+    """Split into ``(keys < key, node holding key or None, keys > key)``."""
+    if node is None:
+        return None, None, None
+    left, right = node.left, node.right
+    if key < node.key:
+        less, found, greater = _split(left, key)
+        return less, found, _join(greater, node, right)
+    if node.key < key:
+        less, found, greater = _split(right, key)
+        return _join(left, node, less), found, greater
+    node.left = node.right = None
+    _update(node)
+    return left, node, right
+
+
+def _union(a: TreeNode[K, V] | None, b: TreeNode[K, V] | None) -> TreeNode[K, V] | None:
+    """Union of two trees, values of ``a`` win on shared keys."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    less, _, greater = _split(b, a.key)
+    left, right = a.left, a.right
+    return _join(_union(left, less), a, _union(right, greater))
+
+
+def _intersection(
+    a: TreeNode[K, V] | None,
+    b: TreeNode[K, V] | None,
+    ) -> TreeNode[K, V] | None:
+    """Keys present in both trees, with the values of ``a``."""
+    if a is None or b is None:
+        return None
+    less, found, greater = _split(b, a.key)
+    left, right = a.left, a.right
+    left = _intersection(left, less)
+    right = _intersection(right, greater)
+    if found is not None:
+        return _join(left, a, right)
+    return _join2(left, right)
+
+
+def _difference(
+    a: TreeNode[K, V] | None,
+    b: TreeNode[K, V] | None,
+    ) -> TreeNode[K, V] | None:
+    """Keys of ``a`` that are not in ``b``."""
+    if a is None or b is None:
+        return a
+    less, _, greater = _split(a, b.key)
+    left, right = b.left, b.right
+    return _join2(_difference(less, left), _difference(greater, right))
+
+
+class AVLTree(Generic[K, V]):
+    """Self-balancing binary search tree mapping unique keys to values.
+
+    Insertions and deletions walk down once while recording the path, then
+    rebalance bottom-up along it, stopping as soon as a subtree is unchanged.
+    Subtree sizes give rank and select in O(log n), and every iterator is
+    lazy, so a range scan costs O(log n + k).
+    """
+
+    __slots__ = ("root",)
+
+    def __init__(self, items: Iterable[K | tuple[K, V]] = ()) -> None:
+        """Initialize a tree from keys or ``(key, value)`` pairs."""
+        self.root: TreeNode[K, V] | None = None
+        for item in items:
+            if isinstance(item, tuple):
+                self.insert(*item)
+            else:
+                self.insert(item)
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[K | tuple[K, V]]) -> AVLTree[K, V]:
+        """Build a tree in O(n) from strictly increasing keys or ``(key, value)``."""
+        entries = [item if isinstance(item, tuple) else (item, None) for item in items]
+        for (a, _), (b, _) in pairwise(entries):
+            if not a < b:
+                msg = "Les clés doivent être strictement croissantes."
+                raise ValueError(msg)
+        tree = cls()
+        tree.root = _build(entries, 0, len(entries))
+        return tree
+
+    def copy(self) -> AVLTree[K, V]:
+        """Return an independent copy, built in O(n)."""
+        return AVLTree.from_sorted(list(self.items()))
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return _size(self.root)
+
+    def _find(self, key: K) -> TreeNode[K, V] | None:
+        """Return the node holding ``key``, or None."""
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def __contains__(self, key: K) -> bool:
+        """Check whether ``key`` is in the tree."""
+        return self._find(key) is not None
+
+    def __getitem__(self, key: K) -> V | None:
+        """Return the value of ``key``."""
+        node = self._find(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """Insert ``key`` or replace its value."""
+        self.insert(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        """Delete ``key``."""
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the value of ``key``, or ``default``."""
+        node = self._find(key)
+        return default if node is None else node.value
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over the keys in increasing order."""
+        return (node.key for node in self._nodes_from())
+
+    def keys(self) -> Iterator[K]:
+        """Iterate over the keys in increasing order."""
+        return iter(self)
+
+    def values(self) -> Iterator[V | None]:
+        """Iterate over the values in key order."""
+        return (node.value for node in self._nodes_from())
+
+    def items(self) -> Iterator[tuple[K, V | None]]:
+        """Iterate over the ``(key, value)`` pairs in key order."""
+        return ((node.key, node.value) for node in self._nodes_from())
+
+    def range(
+        self,
+        lo: K | None = None,
+        hi: K | None = None,
+        ) -> Iterator[tuple[K, V | None]]:
+        """Stream the ``(key, value)`` pairs with ``lo <= key < hi``.
+
+        A bound left to None is unbounded.
+        """
+        for node in self._nodes_from(lo):
+            if hi is not None and not node.key < hi:
+                return
+            yield node.key, node.value
+
+    def _nodes_from(self, lo: K | None = None) -> Iterator[TreeNode[K, V]]:
+        """Lazily yield the nodes with ``key >= lo`` in order."""
+        stack = []
+        node = self.root
+        while node is not None:
+            if lo is not None and node.key < lo:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        while stack:
+            node = stack.pop()
+            yield node
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+    def floor(self, key: K) -> K | None:
+        """Return the greatest key ``<= key``, or None."""
+        best = None
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            else:
+                best = node.key
+                node = node.right
+        return best
+
+    def ceiling(self, key: K) -> K | None:
+        """Return the smallest key ``>= key``, or None."""
+        best = None
+        node = self.root
+        while node is not None:
+            if node.key < key:
+                node = node.right
+            else:
+                best = node.key
+                node = node.left
+        return best
+
+    def min(self) -> K:
+        """Return the smallest key."""
+        node = self.root
+        if node is None:
+            msg = "min() sur un arbre vide"
+            raise ValueError(msg)
+        while node.left is not None:
+            node = node.left
+        return node.key
+
+    def max(self) -> K:
+        """Return the greatest key."""
+        node = self.root
+        if node is None:
+            msg = "max() sur un arbre vide"
+            raise ValueError(msg)
+        while node.right is not None:
+            node = node.right
+        return node.key
+
+    def rank(self, key: K) -> int:
+        """Return the number of keys strictly smaller than ``key``."""
+        rank = 0
+        node = self.root
+        while node is not None:
+            if node.key < key:
+                rank += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return rank
+
+    def select(self, index: int) -> K:
+        """Return the key of the given rank (0-based, negatives count from the end)."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "indice hors de l'arbre"
+            raise IndexError(msg)
+        node = self.root
+        while True:
+            left = _size(node.left)
+            if index < left:
+                node = node.left
+            elif index > left:
+                index -= left + 1
+                node = node.right
+            else:
+                return node.key
+
+    def _fix_path(self, path: list[TreeNode[K, V]]) -> None:
+        """Rebalance the nodes of ``path`` from the bottom up.
+
+        Sizes along ``path`` must already be adjusted by the caller.
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            new = _rebalance(node)
+            if i == 0:
+                self.root = new
+            elif path[i - 1].left is node:
+                path[i - 1].left = new
+            else:
+                path[i - 1].right = new
+            if new is node and node.height == old_height:
+                return
+
+    def insert(self, key: K, value: V | None = None) -> bool:
+        """Insert ``key``, return False if it was present (its value is replaced)."""
+        if self.root is None:
+            self.root = TreeNode(key, value)
+            return True
+        path = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                node.value = value
+                return False
+        for ancestor in path:
+            ancestor.size += 1
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = TreeNode(key, value)
+        else:
+            parent.right = TreeNode(key, value)
+        self._fix_path(path)
+        return True
+
+    def delete(self, key: K) -> bool:
+        """Delete ``key``, return False if it was not present."""
+        path = []
+        node = self.root
+        while node is not None and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is None:
+            return False
+
+        if node.left is not None and node.right is not None:
+            # Move the successor's entry up, then unlink the successor instead.
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.key, node.value = successor.key, successor.value
+            node = successor
+
+        for ancestor in path:
+            ancestor.size -= 1
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self._fix_path(path)
+        return True
+
+    def _take(self, other: AVLTree[K, V]) -> TreeNode[K, V] | None:
+        """Detach and return the nodes of ``other``, which is left empty."""
+        if other is self:
+            msg = "Opération ensembliste d'un arbre avec lui-même."
+            raise ValueError(msg)
+        root, other.root = other.root, None
+        return root
+
+    def join(self, other: AVLTree[K, V]) -> None:
+        """Append all keys of ``other``, which must be greater than ours."""
+        if (
+            self.root is not None
+            and other.root is not None
+            and not self.max() < other.min()
+        ):
+            msg = "Les clés de l'arbre joint doivent être plus grandes."
+            raise ValueError(msg)
+        self.root = _join2(self.root, self._take(other))
+
+    def split(self, key: K) -> AVLTree[K, V]:
+        """Keep the keys ``< key`` and return a new tree with the keys ``>= key``."""
+        less, found, greater = _split(self.root, key)
+        self.root = less
+        upper: AVLTree[K, V] = AVLTree()
+        upper.root = greater if found is None else _join(None, found, greater)
+        return upper
+
+    def update(self, other: AVLTree[K, V]) -> None:
+        """Merge ``other`` into this tree (its values win), ``other`` is emptied."""
+        self.root = _union(self._take(other), self.root)
+
+    def intersection_update(self, other: AVLTree[K, V]) -> None:
+        """Keep only the keys also in ``other``, which is emptied."""
+        self.root = _intersection(self.root, self._take(other))
+
+    def difference_update(self, other: AVLTree[K, V]) -> None:
+        """Remove the keys present in ``other``, which is emptied."""
+        self.root = _difference(self.root, self._take(other))
+
+    def insert_many(self, items: Iterable[K | tuple[K, V]]) -> None:
+        """Insert a batch of keys or ``(key, value)`` pairs, last value wins."""
+        batch = dict(
+            item if isinstance(item, tuple) else (item, None) for item in items
+        )
+        self.update(AVLTree.from_sorted(sorted(batch.items())))
+
+    def delete_many(self, keys: Iterable[K]) -> None:
+        """Delete a batch of keys, missing keys are ignored."""
+        self.difference_update(AVLTree.from_sorted(sorted(set(keys))))
+
+    def union(self, other: AVLTree[K, V]) -> AVLTree[K, V]:
+        """Return a new tree with the keys of both trees, values of ``other`` win."""
+        result = self.copy()
+        result.update(other.copy())
+        return result
+
+    def intersection(self, other: AVLTree[K, V]) -> AVLTree[K, V]:
+        """Return a new tree with the keys common to both trees."""
+        result = self.copy()
+        result.intersection_update(other.copy())
+        return result
+
+    def difference(self, other: AVLTree[K, V]) -> AVLTree[K, V]:
+        """Return a new tree with the keys of this tree not in ``other``."""
+        result = self.copy()
+        result.difference_update(other.copy())
+        return result
+
+    def pre_order(self) -> list[K]:
+        """Return the pre-order traversal of the keys."""
+        order = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            order.append(node.key)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+        return order
+
+    def height(self) -> int:
+        """Return the height of the tree."""
+        return self.root.height if self.root is not None else 0
@@ -1,15 +1,17 @@
 """Sixth exercise."""
 from __future__ import annotations
 
-import time
 from typing import Any, Callable
 
+from benchmark import time_call
 from logger import logger
 
 
 class AVLNode:
     """Node class for AVL Tree."""
 
+    __slots__ = ("height", "key", "left", "right")
+
     def __init__(self, key: int) -> None:
         """Initialize an AVL Node."""
         self.key: int = key
@@ -136,9 +138,16 @@ def avl_delete(node: AVLNode | None, key: int) -> AVLNode | None:
 
 def avl_pre_order(node: AVLNode | None) -> list[int]:
     """Return the pre-order traversal of the AVL tree."""
-    if not node:
-        return []
-    return [node.key, *avl_pre_order(node.left), *avl_pre_order(node.right)]
+    order = []
+    stack = [node] if node else []
+    while stack:
+        current = stack.pop()
+        order.append(current.key)
+        if current.right:
+            stack.append(current.right)
+        if current.left:
+            stack.append(current.left)
+    return order
 
 class BSTNode:
     """Node class for Binary Search Tree (BST)."""
@@ -193,11 +202,12 @@ def bst_pre_order(node: BSTNode | None) -> list[int]:
     return [node.key, *bst_pre_order(node.left), *bst_pre_order(node.right)]
 
 def measure_time(func: Callable[..., Any], *args: object) -> tuple[float, Any]:
-    """Measure the execution time of a function."""
-    start = time.perf_counter()
-    result = func(*args)
-    end = time.perf_counter()
-    return end - start, result
+    """Measure the execution time of a function.
+
+    The timed closures mutate the trees, so they run once without warmup.
+    """
+    result, times = time_call(func, lambda: args, warmup=0, repeat=1)
+    return times[0], result
 
 
 def run(config: dict) -> None:
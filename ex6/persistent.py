@@ -0,0 +1,226 @@
+"""Persistent (path-copying) AVL tree for lock-free snapshot readers."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from _typeshed import SupportsRichComparison
+
+K = TypeVar("K", bound="SupportsRichComparison")
+V = TypeVar("V")
+
+
+class PersistentNode(Generic[K, V]):
+    """Immutable AVL node, never modified once built."""
+
+    __slots__ = ("height", "key", "left", "right", "size", "value")
+
+    def __init__(
+        self,
+        key: K,
+        value: V | None,
+        left: PersistentNode[K, V] | None,
+        right: PersistentNode[K, V] | None,
+        ) -> None:
+        """Build a node and derive its height and size from its children."""
+        self.key = key
+        self.value = value
+        self.left = left
+        self.right = right
+        lh = left.height if left else 0
+        rh = right.height if right else 0
+        self.height = 1 + max(lh, rh)
+        self.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+
+
+def _height(node: PersistentNode[K, V] | None) -> int:
+    """Return the height of a possibly empty subtree."""
+    return node.height if node else 0
+
+
+def _balance(
+    key: K,
+    value: V | None,
+    left: PersistentNode[K, V] | None,
+    right: PersistentNode[K, V] | None,
+    ) -> PersistentNode[K, V]:
+    """Build a balanced node, rotating through fresh copies when needed."""
+    lh, rh = _height(left), _height(right)
+    if lh - rh > 1:
+        if _height(left.left) < _height(left.right):
+            pivot = left.right
+            return PersistentNode(
+                pivot.key,
+                pivot.value,
+                PersistentNode(left.key, left.value, left.left, pivot.left),
+                PersistentNode(key, value, pivot.right, right),
+            )
+        return PersistentNode(
+            left.key,
+            left.value,
+            left.left,
+            PersistentNode(key, value, left.right, right),
+        )
+    if rh - lh > 1:
+        if _height(right.right) < _height(right.left):
+            pivot = right.left
+            return PersistentNode(
+                pivot.key,
+                pivot.value,
+                PersistentNode(key, value, left, pivot.left),
+                PersistentNode(right.key, right.value, pivot.right, right.right),
+            )
+        return PersistentNode(
+            right.key,
+            right.value,
+            PersistentNode(key, value, left, right.left),
+            right.right,
+        )
+    return PersistentNode(key, value, left, right)
+
+
+def _insert(
+    node: PersistentNode[K, V] | None,
+    key: K,
+    value: V | None,
+    ) -> PersistentNode[K, V]:
+    """Return a copy of the path to ``key`` with the entry inserted or replaced."""
+    if node is None:
+        return PersistentNode(key, value, None, None)
+    if key < node.key:
+        left = _insert(node.left, key, value)
+        return _balance(node.key, node.value, left, node.right)
+    if node.key < key:
+        right = _insert(node.right, key, value)
+        return _balance(node.key, node.value, node.left, right)
+    return PersistentNode(key, value, node.left, node.right)
+
+
+def _delete_min(
+    node: PersistentNode[K, V],
+    ) -> tuple[PersistentNode[K, V] | None, PersistentNode[K, V]]:
+    """Return ``(tree without its minimum, minimum node)``."""
+    if node.left is None:
+        return node.right, node
+    left, smallest = _delete_min(node.left)
+    return _balance(node.key, node.value, left, node.right), smallest
+
+
+def _delete(
+    node: PersistentNode[K, V] | None,
+    key: K,
+    ) -> PersistentNode[K, V] | None:
+    """Return a copy of the path to ``key`` with the entry removed."""
+    if node is None:
+        return None
+    if key < node.key:
+        return _balance(node.key, node.value, _delete(node.left, key), node.right)
+    if node.key < key:
+        return _balance(node.key, node.value, node.left, _delete(node.right, key))
+    if node.left is None:
+        return node.right
+    if node.right is None:
+        return node.left
+    right, successor = _delete_min(node.right)
+    return _balance(successor.key, successor.value, node.left, right)
+
+
+class PersistentAVL(Generic[K, V]):
+    """Immutable sorted map: every update returns a new version.
+
+    Updates copy only the O(log n) nodes on the path to the key and share
+    every other subtree with the previous version. A reader that keeps a
+    reference to a version sees a consistent snapshot without locking, while
+    a writer publishes new versions by rebinding a single reference.
+    """
+
+    __slots__ = ("root",)
+
+    def __init__(self, root: PersistentNode[K, V] | None = None) -> None:
+        """Wrap an existing (shared) root."""
+        self.root = root
+
+    @classmethod
+    def from_items(cls, items: Iterable[K | tuple[K, V]]) -> PersistentAVL[K, V]:
+        """Build a tree from keys or ``(key, value)`` pairs."""
+        root = None
+        for item in items:
+            key, value = item if isinstance(item, tuple) else (item, None)
+            root = _insert(root, key, value)
+        return cls(root)
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return self.root.size if self.root else 0
+
+    def _find(self, key: K) -> PersistentNode[K, V] | None:
+        """Return the node holding ``key``, or None."""
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def __contains__(self, key: K) -> bool:
+        """Check whether ``key`` is in this version."""
+        return self._find(key) is not None
+
+    def __getitem__(self, key: K) -> V | None:
+        """Return the value of ``key``."""
+        node = self._find(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the value of ``key``, or ``default``."""
+        node = self._find(key)
+        return default if node is None else node.value
+
+    def insert(self, key: K, value: V | None = None) -> PersistentAVL[K, V]:
+        """Return a new version with ``key`` inserted or its value replaced."""
+        return PersistentAVL(_insert(self.root, key, value))
+
+    def delete(self, key: K) -> PersistentAVL[K, V]:
+        """Return a new version without ``key`` (this one if it is absent)."""
+        if key not in self:
+            return self
+        return PersistentAVL(_delete(self.root, key))
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over the keys of this version in increasing order."""
+        return (key for key, _ in self.range())
+
+    def items(self) -> Iterator[tuple[K, V | None]]:
+        """Iterate over the ``(key, value)`` pairs in key order."""
+        return self.range()
+
+    def range(
+        self,
+        lo: K | None = None,
+        hi: K | None = None,
+        ) -> Iterator[tuple[K, V | None]]:
+        """Stream the ``(key, value)`` pairs with ``lo <= key < hi``."""
+        stack = []
+        node = self.root
+        while node is not None:
+            if lo is not None and node.key < lo:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        while stack:
+            node = stack.pop()
+            if hi is not None and not node.key < hi:
+                return
+            yield node.key, node.value
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
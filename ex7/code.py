@@ -1,9 +1,14 @@
 """Seventh exercise."""
-import time
+import statistics
 from collections.abc import Sequence
 from itertools import permutations
 from typing import Any, Callable
 
+from benchmark import time_call
+from ex7.sat import solve
+from ex7.tsp_exact import branch_and_bound, held_karp
+from ex7.tsp_local import TSPInstance, improve_tour
+from ex7.tsp_parallel import parallel_brute_force
 from logger import logger
 
 
@@ -71,17 +76,19 @@ def tsp_brute_force(matrix: Sequence[Sequence[float]]) -> tuple[list[int], float
             best_path = path
     return best_path, min_distance
 
-def measure_time(func: Callable[..., Any], *args: object) -> tuple[Any, float]:
-    """Measure the execution time of a function."""
-    start = time.perf_counter()
-    result = func(*args)
-    duration = time.perf_counter() - start
-    return result, duration
+def measure_time(
+    func: Callable[..., Any],
+    *args: object,
+    warmup: int = 1,
+    repeat: int = 5,
+    ) -> tuple[Any, float]:
+    """Measure the median execution time of a function over a few runs."""
+    result, times = time_call(func, lambda: args, warmup=warmup, repeat=repeat)
+    return result, statistics.median(times)
 
-def run(config: dict) -> None:
-    """Run the SAT and TSP algorithms."""
+def run_sat(sat_data: dict) -> None:
+    """Check the given assignment, then solve the formula with CDCL."""
     logger.info("Vérification SAT :")
-    sat_data = config.get("sat", {})
     clauses = sat_data.get("clauses", [])
     assignment = sat_data.get("assignment", {})
     if clauses and assignment:
@@ -90,23 +97,73 @@ def run(config: dict) -> None:
         logger.info(f"Temps SAT : {t_sat:.6f} s")
     else:
         logger.error("Pas de données SAT fournies.")
+    if clauses:
+        (model, t_cdcl) = measure_time(solve, clauses)
+        verdict = model if model is not None else "Non satisfiable"
+        logger.info(f"Solveur CDCL : {verdict}")
+        logger.info(f"Temps CDCL : {t_cdcl:.6f} s")
 
-    logger.info("Heuristique TSP (plus proche voisin) :")
-    tsp_data = config.get("tsp", {})
-    matrix = tsp_data.get("distances", [])
+
+def run_tsp_exact(
+    matrix: Sequence[Sequence[float]],
+    approx_result: tuple[list[int], float],
+    ) -> None:
+    """Run the exact TSP solvers small enough for ``matrix``."""
     matrix_length_limit = 8
-    if matrix:
-        (approx_result, t_heuristic) = measure_time(tsp_nearest_neighbor, matrix)
-        logger.info(f"Chemin heuristique : {approx_result[0]}")
-        logger.info(f"Distance heuristique : {approx_result[1]}")
-        logger.info(f"Temps heuristique : {t_heuristic:.6f} s")
-
-        if len(matrix) <= matrix_length_limit:
-            (brute_result, t_brute) = measure_time(tsp_brute_force, matrix)
-            logger.info(f"Chemin optimal (brute force) : {brute_result[0]}")
-            logger.info(f"Distance brute force : {brute_result[1]}")
-            logger.info(f"Temps brute force : {t_brute:.6f} s")
-        else:
-            logger.error("Graphe trop grand pour brute force (>8 noeuds).")
+    parallel_length_limit = 12
+    exact_length_limit = 20
+    if len(matrix) <= matrix_length_limit:
+        (brute_result, t_brute) = measure_time(tsp_brute_force, matrix)
+        logger.info(f"Chemin optimal (brute force) : {brute_result[0]}")
+        logger.info(f"Distance brute force : {brute_result[1]}")
+        logger.info(f"Temps brute force : {t_brute:.6f} s")
     else:
+        logger.error("Graphe trop grand pour brute force (>8 noeuds).")
+
+    if len(matrix) <= parallel_length_limit:
+        # Each run starts its own process pool, so it runs once, unwarmed.
+        (par_result, t_par) = measure_time(
+            parallel_brute_force, matrix, None, approx_result, warmup=0, repeat=1,
+        )
+        logger.info(f"Chemin optimal (brute force parallèle) : {par_result[0]}")
+        logger.info(f"Distance brute force parallèle : {par_result[1]}")
+        logger.info(f"Temps brute force parallèle : {t_par:.6f} s")
+
+    if len(matrix) <= exact_length_limit:
+        (hk_result, t_hk) = measure_time(held_karp, matrix)
+        logger.info(f"Chemin optimal (Held-Karp) : {hk_result[0]}")
+        logger.info(f"Distance Held-Karp : {hk_result[1]}")
+        logger.info(f"Temps Held-Karp : {t_hk:.6f} s")
+        (bb_result, t_bb) = measure_time(branch_and_bound, matrix, approx_result)
+        logger.info(f"Chemin optimal (séparation et évaluation) : {bb_result[0]}")
+        logger.info(f"Distance séparation et évaluation : {bb_result[1]}")
+        logger.info(f"Temps séparation et évaluation : {t_bb:.6f} s")
+    else:
+        logger.error("Graphe trop grand pour les solveurs exacts (>20 noeuds).")
+
+
+def run_tsp(tsp_data: dict) -> None:
+    """Run the TSP heuristics, then the exact solvers."""
+    logger.info("Heuristique TSP (plus proche voisin) :")
+    matrix = tsp_data.get("distances", [])
+    if not matrix:
         logger.error("Pas de données TSP fournies.")
+        return
+    (approx_result, t_heuristic) = measure_time(tsp_nearest_neighbor, matrix)
+    logger.info(f"Chemin heuristique : {approx_result[0]}")
+    logger.info(f"Distance heuristique : {approx_result[1]}")
+    logger.info(f"Temps heuristique : {t_heuristic:.6f} s")
+
+    instance = TSPInstance.from_matrix(matrix)
+    (local_result, t_local) = measure_time(improve_tour, instance, approx_result[0])
+    logger.info(f"Chemin amélioré (2-opt / Or-opt) : {local_result[0]}")
+    logger.info(f"Distance améliorée : {local_result[1]}")
+    logger.info(f"Temps amélioration : {t_local:.6f} s")
+
+    run_tsp_exact(matrix, approx_result)
+
+
+def run(config: dict) -> None:
+    """Run the SAT and TSP algorithms."""
+    run_sat(config.get("sat", {}))
+    run_tsp(config.get("tsp", {}))
@@ -0,0 +1,256 @@
+"""Compiled CNF formulas for fast, batched and incremental evaluation."""
+from __future__ import annotations
+
+import random
+from array import array
+from typing import TYPE_CHECKING
+
+from ex7.sat import encode_clauses
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from numpy.typing import ArrayLike
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+class CompiledCNF:
+    """CNF formula with literals int-coded once, stored in CSR form.
+
+    Variable ``v`` (0-based) has the literal codes ``2v`` (positive) and
+    ``2v + 1`` (negative). The literals of clause ``c`` are the slots
+    ``offsets[c]:offsets[c + 1]`` of ``literals``, and the clauses containing
+    literal ``l`` are ``occ_clauses[occ_offsets[l]:occ_offsets[l + 1]]``.
+    An assignment is a sequence of booleans indexed by variable id.
+
+    Repeated literals are merged and tautological clauses dropped when
+    compiling, so each clause mentions a variable at most once.
+    """
+
+    __slots__ = ("index", "literals", "names", "occ_clauses", "occ_offsets", "offsets")
+
+    def __init__(self, names: Sequence[str], clauses: Iterable[Sequence[int]]) -> None:
+        """Compile DIMACS-style clauses over the variables ``names``."""
+        self.names: list[str] = list(names)
+        self.index: dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.literals = array("i")
+        self.offsets = array("q", [0])
+        for clause in clauses:
+            codes = dict.fromkeys(2 * (abs(lit) - 1) + (lit < 0) for lit in clause)
+            if any(lit ^ 1 in codes for lit in codes):
+                continue
+            self.literals.extend(codes)
+            self.offsets.append(len(self.literals))
+
+        counts = [0] * (2 * len(self.names) + 1)
+        for lit in self.literals:
+            counts[lit + 1] += 1
+        self.occ_offsets = array("q", counts)
+        for lit in range(2 * len(self.names)):
+            self.occ_offsets[lit + 1] += self.occ_offsets[lit]
+        cursor = array("q", self.occ_offsets[:-1])
+        self.occ_clauses = array("i", bytes(4 * len(self.literals)))
+        for c in range(self.num_clauses):
+            for k in range(self.offsets[c], self.offsets[c + 1]):
+                lit = self.literals[k]
+                self.occ_clauses[cursor[lit]] = c
+                cursor[lit] += 1
+
+    @classmethod
+    def from_clauses(cls, clauses: Iterable[Sequence[str]]) -> CompiledCNF:
+        """Compile clauses in the ``[["A", "-B"], ...]`` format."""
+        names, encoded = encode_clauses(clauses)
+        return cls(names, encoded)
+
+    @classmethod
+    def from_dimacs(
+        cls,
+        num_vars: int,
+        clauses: Iterable[Sequence[int]],
+        ) -> CompiledCNF:
+        """Compile DIMACS clauses, naming variable ``i`` as ``"i"``."""
+        return cls([str(i) for i in range(1, num_vars + 1)], clauses)
+
+    @property
+    def num_vars(self) -> int:
+        """Number of variables."""
+        return len(self.names)
+
+    @property
+    def num_clauses(self) -> int:
+        """Number of clauses."""
+        return len(self.offsets) - 1
+
+    def encode(self, assignment: Mapping[str, bool]) -> bytearray:
+        """Turn a name -> value mapping into a vector (missing variables are false)."""
+        values = bytearray(self.num_vars)
+        for name, value in assignment.items():
+            var = self.index.get(name)
+            if var is not None:
+                values[var] = bool(value)
+        return values
+
+    def decode(self, values: Sequence[bool]) -> dict[str, bool]:
+        """Turn a value vector back into a name -> value mapping."""
+        return {
+            name: bool(value)
+            for name, value in zip(self.names, values, strict=True)
+        }
+
+    def is_satisfied(self, values: Sequence[bool]) -> bool:
+        """Check one assignment vector against every clause."""
+        literals = self.literals
+        offsets = self.offsets
+        for c in range(self.num_clauses):
+            for k in range(offsets[c], offsets[c + 1]):
+                lit = literals[k]
+                if values[lit >> 1] != (lit & 1):
+                    break
+            else:
+                return False
+        return True
+
+    def check(self, assignment: Mapping[str, bool]) -> bool:
+        """Check ``assignment`` like ``ex7.code.is_satisfiable`` does."""
+        return self.is_satisfied(self.encode(assignment))
+
+    def satisfied_clauses_batch(self, assignments: ArrayLike) -> np.ndarray:
+        """Return a ``(k, num_clauses)`` boolean matrix of satisfied clauses.
+
+        ``assignments`` is a ``(k, num_vars)`` boolean matrix, one assignment
+        per row.
+        """
+        if np is None:
+            msg = "NumPy est requis pour satisfied_clauses_batch()."
+            raise ImportError(msg)
+        assignments = np.asarray(assignments, dtype=bool)
+        literals = np.frombuffer(self.literals, dtype=np.int32)
+        offsets = np.frombuffer(self.offsets, dtype=np.int64)
+        truth = assignments[:, literals >> 1] != (literals & 1).astype(bool)
+
+        result = np.zeros((assignments.shape[0], self.num_clauses), dtype=bool)
+        nonempty = offsets[1:] > offsets[:-1]
+        if nonempty.any():
+            # Empty clauses have no slot, so the other segments stay contiguous.
+            result[:, nonempty] = np.logical_or.reduceat(
+                truth, offsets[:-1][nonempty], axis=1,
+            )
+        return result
+
+    def check_batch(self, assignments: ArrayLike) -> np.ndarray:
+        """Return which rows of a ``(k, num_vars)`` matrix satisfy the formula."""
+        return self.satisfied_clauses_batch(assignments).all(axis=1)
+
+    def count_unsatisfied_batch(self, assignments: ArrayLike) -> np.ndarray:
+        """Return the number of violated clauses for each row of the matrix."""
+        return (~self.satisfied_clauses_batch(assignments)).sum(axis=1)
+
+
+class IncrementalEvaluator:
+    """Assignment kept in sync with per-clause true-literal counts.
+
+    Flipping a variable only visits the clauses containing it, and the
+    unsatisfied clauses are kept in an array with O(1) insertion and removal.
+    """
+
+    def __init__(self, cnf: CompiledCNF, values: Sequence[bool]) -> None:
+        """Evaluate ``cnf`` under the initial assignment vector ``values``."""
+        self.cnf = cnf
+        self.values = bytearray(bool(v) for v in values)
+        self.true_count = array("i", bytes(4 * cnf.num_clauses))
+        self.unsat = array("i")
+        self.position = array("i", [-1]) * cnf.num_clauses
+        literals = cnf.literals
+        for c in range(cnf.num_clauses):
+            count = 0
+            for k in range(cnf.offsets[c], cnf.offsets[c + 1]):
+                lit = literals[k]
+                count += self.values[lit >> 1] != (lit & 1)
+            self.true_count[c] = count
+            if count == 0:
+                self._add_unsat(c)
+
+    def _add_unsat(self, c: int) -> None:
+        """Append clause ``c`` to the unsatisfied array."""
+        self.position[c] = len(self.unsat)
+        self.unsat.append(c)
+
+    def _remove_unsat(self, c: int) -> None:
+        """Swap clause ``c`` out of the unsatisfied array."""
+        slot = self.position[c]
+        last = self.unsat.pop()
+        if last != c:
+            self.unsat[slot] = last
+            self.position[last] = slot
+        self.position[c] = -1
+
+    @property
+    def num_unsatisfied(self) -> int:
+        """Number of clauses violated by the current assignment."""
+        return len(self.unsat)
+
+    def _occurrences(self, lit: int) -> array:
+        """Return the clauses containing literal ``lit``."""
+        occ_offsets = self.cnf.occ_offsets
+        return self.cnf.occ_clauses[occ_offsets[lit]:occ_offsets[lit + 1]]
+
+    def flip(self, var: int) -> None:
+        """Negate ``var`` and update the clause counts it touches."""
+        old = self.values[var]
+        self.values[var] = 1 - old
+        made = 2 * var + old  # the literal of ``var`` that becomes true
+        true_count = self.true_count
+        for c in self._occurrences(made):
+            true_count[c] += 1
+            if true_count[c] == 1:
+                self._remove_unsat(c)
+        for c in self._occurrences(made ^ 1):
+            true_count[c] -= 1
+            if true_count[c] == 0:
+                self._add_unsat(c)
+
+    def break_count(self, var: int) -> int:
+        """Count the clauses that flipping ``var`` would leave unsatisfied."""
+        true_count = self.true_count
+        lit = 2 * var + 1 - self.values[var]
+        return sum(1 for c in self._occurrences(lit) if true_count[c] == 1)
+
+    def make_count(self, var: int) -> int:
+        """Count the unsatisfied clauses that flipping ``var`` would satisfy."""
+        true_count = self.true_count
+        lit = 2 * var + self.values[var]
+        return sum(1 for c in self._occurrences(lit) if true_count[c] == 0)
+
+
+def walksat(
+    cnf: CompiledCNF,
+    max_flips: int = 100_000,
+    noise: float = 0.5,
+    seed: int | None = None,
+    ) -> dict[str, bool] | None:
+    """WalkSAT local search; return a satisfying assignment or None if none found."""
+    rng = random.Random(seed)  # noqa: S311 - search randomness, not crypto
+    evaluator = IncrementalEvaluator(
+        cnf, [rng.random() < 0.5 for _ in range(cnf.num_vars)],  # noqa: PLR2004
+    )
+    literals = cnf.literals
+    offsets = cnf.offsets
+    for _ in range(max_flips):
+        if not evaluator.unsat:
+            return cnf.decode(evaluator.values)
+        c = evaluator.unsat[rng.randrange(len(evaluator.unsat))]
+        candidates = [literals[k] >> 1 for k in range(offsets[c], offsets[c + 1])]
+        if not candidates:
+            return None  # empty clause
+        breaks = [evaluator.break_count(var) for var in candidates]
+        best = min(breaks)
+        if best > 0 and rng.random() < noise:
+            var = rng.choice(candidates)
+        else:
+            var = candidates[breaks.index(best)]
+        evaluator.flip(var)
+    return cnf.decode(evaluator.values) if not evaluator.unsat else None
@@ -0,0 +1,420 @@
+"""Conflict-driven clause learning (CDCL) SAT solver."""
+from __future__ import annotations
+
+import heapq
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+TRUE = 1
+FALSE = -1
+UNASSIGNED = 0
+
+VAR_DECAY = 0.95
+CLAUSE_DECAY = 0.999
+RESCALE_LIMIT = 1e100
+RESTART_BASE = 100
+LEARNT_GROWTH = 1.1
+
+
+def encode_clauses(
+    clauses: Iterable[Sequence[str]],
+    ) -> tuple[list[str], list[list[int]]]:
+    """Encode ``[["A", "-B"], ...]`` once as DIMACS-style signed integers.
+
+    Returns ``(names, encoded)`` where variable ``i`` (1-based) is
+    ``names[i - 1]`` and ``-i`` is its negation.
+    """
+    index: dict[str, int] = {}
+    names: list[str] = []
+    encoded = []
+    for clause in clauses:
+        row = []
+        for literal in clause:
+            negated = literal.startswith("-")
+            name = literal[1:] if negated else literal
+            var = index.get(name)
+            if var is None:
+                names.append(name)
+                var = index[name] = len(names)
+            row.append(-var if negated else var)
+        encoded.append(row)
+    return names, encoded
+
+
+def read_dimacs(path: str | Path) -> tuple[int, list[list[int]]]:
+    """Read a DIMACS CNF file and return ``(num_vars, clauses)``."""
+    num_vars = 0
+    clauses = []
+    clause: list[int] = []
+    with Path(path).open() as file:
+        for line in file:
+            line = line.strip()  # noqa: PLW2901
+            if not line or line[0] == "c":
+                continue
+            if line[0] == "p":
+                fields = line.split()
+                if len(fields) != 4 or fields[1] != "cnf":  # noqa: PLR2004
+                    msg = f"En-tête DIMACS invalide : {line!r}"
+                    raise ValueError(msg)
+                num_vars = int(fields[2])
+                continue
+            if line[0] == "%":
+                break
+            for token in line.split():
+                literal = int(token)
+                if literal == 0:
+                    clauses.append(clause)
+                    clause = []
+                else:
+                    clause.append(literal)
+                    num_vars = max(num_vars, abs(literal))
+    if clause:
+        clauses.append(clause)
+    return num_vars, clauses
+
+
+def _luby(i: int) -> int:
+    """Return the ``i``-th term (0-based) of the Luby sequence 1, 1, 2, 1, 1, 2, 4..."""
+    size, power = 1, 0
+    while size < i + 1:
+        power += 1
+        size = 2 * size + 1
+    while size - 1 != i:
+        size = (size - 1) >> 1
+        power -= 1
+        i %= size
+    return 1 << power
+
+
+class CDCLSolver:
+    """CDCL solver over DIMACS-style clauses.
+
+    Internally variable ``v`` (0-based) has the literal codes ``2v`` (true)
+    and ``2v + 1`` (false), so negation is ``lit ^ 1`` and per-literal data
+    lives in flat lists. Propagation uses two watched literals, conflicts are
+    analysed to the first UIP, branching follows VSIDS with phase saving,
+    restarts follow the Luby sequence and the least active learned clauses
+    are periodically dropped.
+    """
+
+    def __init__(self, num_vars: int, clauses: Iterable[Sequence[int]] = ()) -> None:
+        """Create a solver over ``num_vars`` variables and add ``clauses``."""
+        self.num_vars = num_vars
+        self.values = [UNASSIGNED] * (2 * num_vars)
+        self.level = [0] * num_vars
+        self.reason: list[int | None] = [None] * num_vars
+        self.phase = [1] * num_vars
+        self.activity = [0.0] * num_vars
+        self.var_inc = 1.0
+        self.heap = [(0.0, v) for v in range(num_vars)]
+        self.seen = bytearray(num_vars)
+
+        self.clauses: list[list[int] | None] = []
+        self.clause_activity: list[float] = []
+        self.clause_inc = 1.0
+        self.learnts: list[int] = []
+        self.watches: list[list[int]] = [[] for _ in range(2 * num_vars)]
+
+        self.trail: list[int] = []
+        self.trail_lim: list[int] = []
+        self.qhead = 0
+        self.ok = True
+        self.conflicts = 0
+        self.decisions = 0
+
+        for clause in clauses:
+            self.add_clause(clause)
+        self.max_learnts = max(len(self.clauses) / 3, 1000)
+
+    def add_clause(self, clause: Iterable[int]) -> bool:
+        """Add a DIMACS clause at level 0; return False if the formula became UNSAT."""
+        if not self.ok:
+            return False
+        lits = set()
+        for literal in clause:
+            code = 2 * (abs(literal) - 1) + (literal < 0)
+            if code ^ 1 in lits or self.values[code] == TRUE:
+                return True  # tautology or already satisfied
+            if self.values[code] == UNASSIGNED:
+                lits.add(code)
+        if not lits:
+            self.ok = False
+        elif len(lits) == 1:
+            self._assign(lits.pop(), None)
+            self.ok = self._propagate() is None
+        else:
+            self._attach(list(lits))
+        return self.ok
+
+    def _attach(self, lits: list[int]) -> int:
+        """Store a clause and watch its first two literals."""
+        index = len(self.clauses)
+        self.clauses.append(lits)
+        self.clause_activity.append(0.0)
+        self.watches[lits[0]].append(index)
+        self.watches[lits[1]].append(index)
+        return index
+
+    def _assign(self, lit: int, reason: int | None) -> None:
+        """Make ``lit`` true at the current decision level."""
+        var = lit >> 1
+        self.values[lit] = TRUE
+        self.values[lit ^ 1] = FALSE
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(lit)
+
+    def _propagate(self) -> int | None:
+        """Run unit propagation; return the index of a conflicting clause, if any."""
+        trail = self.trail
+        values = self.values
+        watches = self.watches
+        clauses = self.clauses
+        qhead = self.qhead
+        while qhead < len(trail):
+            false_lit = trail[qhead] ^ 1
+            qhead += 1
+            watching = watches[false_lit]
+            i = j = 0
+            n = len(watching)
+            while i < n:
+                index = watching[i]
+                i += 1
+                clause = clauses[index]
+                if clause is None:
+                    continue  # deleted learned clause: drop the stale watch
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], false_lit
+                first = clause[0]
+                if values[first] == TRUE:
+                    watching[j] = index
+                    j += 1
+                    continue
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if values[lit] != FALSE:
+                        clause[1] = lit
+                        clause[k] = false_lit
+                        watches[lit].append(index)
+                        break
+                else:
+                    watching[j] = index
+                    j += 1
+                    if values[first] == FALSE:
+                        del watching[j:i]
+                        self.qhead = len(trail)
+                        return index
+                    self._assign(first, index)
+            del watching[j:]
+        self.qhead = qhead
+        return None
+
+    def _bump_var(self, var: int) -> None:
+        """Increase the VSIDS activity of ``var``."""
+        self.activity[var] += self.var_inc
+        if self.activity[var] > RESCALE_LIMIT:
+            self.activity = [a / RESCALE_LIMIT for a in self.activity]
+            self.var_inc /= RESCALE_LIMIT
+            self._rebuild_heap()
+        elif self.values[2 * var] == UNASSIGNED:
+            heapq.heappush(self.heap, (-self.activity[var], var))
+
+    def _bump_clause(self, index: int) -> None:
+        """Increase the activity of a learned clause."""
+        self.clause_activity[index] += self.clause_inc
+        if self.clause_activity[index] > RESCALE_LIMIT:
+            self.clause_activity = [a / RESCALE_LIMIT for a in self.clause_activity]
+            self.clause_inc /= RESCALE_LIMIT
+
+    def _rebuild_heap(self) -> None:
+        """Rebuild the lazy VSIDS heap from the unassigned variables."""
+        self.heap = [
+            (-self.activity[v], v)
+            for v in range(self.num_vars)
+            if self.values[2 * v] == UNASSIGNED
+        ]
+        heapq.heapify(self.heap)
+
+    def _pick_branch_var(self) -> int | None:
+        """Pop the most active unassigned variable, skipping stale heap entries."""
+        heap = self.heap
+        while heap:
+            key, var = heapq.heappop(heap)
+            if self.values[2 * var] == UNASSIGNED and -key == self.activity[var]:
+                return var
+        return None
+
+    def _analyze(self, conflict: int) -> tuple[list[int], int]:
+        """Derive the first-UIP clause of a conflict and its backjump level."""
+        seen = self.seen
+        level = self.level
+        trail = self.trail
+        current = len(self.trail_lim)
+        learnt = [0]
+        pending = 0
+        lit = None
+        index = len(trail) - 1
+        reason = conflict
+        clause = self.clauses[reason]
+        while True:
+            self._bump_clause(reason)
+            for q in clause if lit is None else clause[1:]:
+                var = q >> 1
+                if not seen[var] and level[var] > 0:
+                    seen[var] = 1
+                    self._bump_var(var)
+                    if level[var] >= current:
+                        pending += 1
+                    else:
+                        learnt.append(q)
+            while not seen[trail[index] >> 1]:
+                index -= 1
+            lit = trail[index]
+            index -= 1
+            seen[lit >> 1] = 0
+            pending -= 1
+            if pending == 0:
+                break
+            reason = self.reason[lit >> 1]
+            clause = self.clauses[reason]
+        learnt[0] = lit ^ 1
+
+        kept = self._minimize(learnt)
+        if len(kept) == 1:
+            return kept, 0
+        best = max(range(1, len(kept)), key=lambda k: level[kept[k] >> 1])
+        kept[1], kept[best] = kept[best], kept[1]
+        return kept, level[kept[1] >> 1]
+
+    def _minimize(self, learnt: list[int]) -> list[int]:
+        """Drop the learnt literals implied by the rest of the clause.
+
+        This is local minimization: a literal goes when every other literal of
+        its reason is in the clause or fixed at level 0. The ``seen`` marks of
+        the learnt literals are cleared on the way out.
+        """
+        seen = self.seen
+        level = self.level
+        kept = [learnt[0]]
+        for q in learnt[1:]:
+            reason = self.reason[q >> 1]
+            if reason is None or any(
+                not seen[r >> 1] and level[r >> 1] > 0
+                for r in self.clauses[reason][1:]
+            ):
+                kept.append(q)
+        for q in learnt[1:]:
+            seen[q >> 1] = 0
+        return kept
+
+    def _backtrack(self, target: int) -> None:
+        """Undo every assignment above decision level ``target``."""
+        if len(self.trail_lim) <= target:
+            return
+        values = self.values
+        start = self.trail_lim[target]
+        for lit in self.trail[start:]:
+            var = lit >> 1
+            values[lit] = values[lit ^ 1] = UNASSIGNED
+            self.reason[var] = None
+            self.phase[var] = lit & 1
+            heapq.heappush(self.heap, (-self.activity[var], var))
+        del self.trail[start:]
+        del self.trail_lim[target:]
+        self.qhead = len(self.trail)
+        if len(self.heap) > 4 * self.num_vars + 1000:
+            self._rebuild_heap()
+
+    def _locked(self, index: int) -> bool:
+        """Check whether a clause is the reason of a current assignment."""
+        first = self.clauses[index][0]
+        return self.values[first] == TRUE and self.reason[first >> 1] == index
+
+    def _reduce_learnts(self) -> None:
+        """Delete the less active half of the learned clauses."""
+        activity = self.clause_activity
+        self.learnts.sort(key=activity.__getitem__)
+        half = len(self.learnts) // 2
+        kept = []
+        for rank, index in enumerate(self.learnts):
+            clause = self.clauses[index]
+            removable = len(clause) > 2 and not self._locked(index)  # noqa: PLR2004
+            if rank < half and removable:
+                self.clauses[index] = None  # watches are dropped lazily
+            else:
+                kept.append(index)
+        self.learnts = kept
+
+    def _search(self, budget: int) -> bool | None:
+        """Search until a model, a refutation or ``budget`` conflicts."""
+        conflicts = 0
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                conflicts += 1
+                if not self.trail_lim:
+                    return False
+                learnt, level = self._analyze(conflict)
+                self._backtrack(level)
+                if len(learnt) == 1:
+                    self._assign(learnt[0], None)
+                else:
+                    index = self._attach(learnt)
+                    self.learnts.append(index)
+                    self._bump_clause(index)
+                    self._assign(learnt[0], index)
+                self.var_inc /= VAR_DECAY
+                self.clause_inc /= CLAUSE_DECAY
+                continue
+
+            if conflicts >= budget:
+                self._backtrack(0)
+                return None
+            if len(self.learnts) - len(self.trail) >= self.max_learnts:
+                self._reduce_learnts()
+            var = self._pick_branch_var()
+            if var is None:
+                return True
+            self.decisions += 1
+            self.trail_lim.append(len(self.trail))
+            self._assign(2 * var + self.phase[var], None)
+
+    def solve(self) -> list[int] | None:
+        """Return a model as DIMACS literals (``v`` or ``-v``), or None if UNSAT."""
+        if not self.ok:
+            return None
+        restarts = 0
+        while True:
+            status = self._search(RESTART_BASE * _luby(restarts))
+            if status is not None:
+                break
+            restarts += 1
+            self.max_learnts *= LEARNT_GROWTH
+        if not status:
+            self.ok = False
+            return None
+        model = [
+            v + 1 if self.values[2 * v] == TRUE else -(v + 1)
+            for v in range(self.num_vars)
+        ]
+        self._backtrack(0)
+        return model
+
+
+def solve(clauses: Sequence[Sequence[str]]) -> dict[str, bool] | None:
+    """Find an assignment satisfying ``[["A", "-B"], ...]``, or None if UNSAT."""
+    names, encoded = encode_clauses(clauses)
+    model = CDCLSolver(len(names), encoded).solve()
+    if model is None:
+        return None
+    return {names[abs(lit) - 1]: lit > 0 for lit in model}
+
+
+def solve_dimacs(path: str | Path) -> list[int] | None:
+    """Solve a DIMACS CNF file and return a model as signed literals, or None."""
+    num_vars, clauses = read_dimacs(path)
+    return CDCLSolver(num_vars, clauses).solve()
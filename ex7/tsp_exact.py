@@ -0,0 +1,214 @@
+"""Exact TSP solvers: Held-Karp dynamic programming and branch-and-bound."""
+from __future__ import annotations
+
+import math
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+HELD_KARP_MAX_BYTES = 2 << 30
+
+
+def held_karp_memory(n: int) -> int:
+    """Estimate the bytes used by the Held-Karp tables for ``n`` cities.
+
+    City 0 is fixed as the start, so both tables hold ``2^(n-1) * (n-1)``
+    cells: a float64 distance and an int8 predecessor.
+    """
+    if n < 2:  # noqa: PLR2004
+        return 0
+    return (1 << (n - 1)) * (n - 1) * (8 + 1)
+
+
+def tour_length(matrix: Sequence[Sequence[float]], path: Sequence[int]) -> float:
+    """Return the length of a closed path ``[0, ..., 0]``."""
+    return sum(matrix[path[i]][path[i + 1]] for i in range(len(path) - 1))
+
+
+def _held_karp_numpy(matrix: Sequence[Sequence[float]]) -> tuple[list[int], float]:
+    """Held-Karp vectorized over all subsets of the same size."""
+    d = np.asarray(matrix, dtype=np.float64)
+    m = len(d) - 1
+    full = 1 << m
+    inner = d[1:, 1:]
+    dist = np.full((full, m), np.inf)
+    parent = np.full((full, m), -1, dtype=np.int8)
+    for j in range(m):
+        dist[1 << j, j] = d[0, j + 1]
+
+    masks = np.arange(full, dtype=np.int64)
+    popcount = np.zeros(full, dtype=np.int8)
+    for j in range(m):
+        popcount += ((masks >> j) & 1).astype(np.int8)
+    order = np.argsort(popcount, kind="stable")
+    bounds = np.searchsorted(popcount[order], np.arange(m + 2))
+
+    for size in range(2, m + 1):
+        layer = order[bounds[size]:bounds[size + 1]]
+        for j in range(m):
+            subset = layer[(layer >> j) & 1 == 1]
+            # dist[prev, j] is inf because j is not in prev, so k == j never wins.
+            candidates = dist[subset ^ (1 << j)] + inner[:, j]
+            best = candidates.argmin(axis=1)
+            dist[subset, j] = candidates[np.arange(len(subset)), best]
+            parent[subset, j] = best
+
+    closing = dist[full - 1] + d[1:, 0]
+    last = int(closing.argmin())
+    length = float(closing[last])
+    path = [0]
+    mask = full - 1
+    while last >= 0:
+        path.append(last + 1)
+        mask, last = mask ^ (1 << last), int(parent[mask, last])
+    path.append(0)
+    path[1:-1] = path[-2:0:-1]
+    return path, length
+
+
+def _held_karp_arrays(matrix: Sequence[Sequence[float]]) -> tuple[list[int], float]:
+    """Held-Karp over flat ``array`` tables, ``mask * m + j`` indexed."""
+    m = len(matrix) - 1
+    full = 1 << m
+    dist = array("d", [math.inf]) * (full * m)
+    parent = array("b", [-1]) * (full * m)
+    for j in range(m):
+        dist[(1 << j) * m + j] = matrix[0][j + 1]
+
+    for mask in range(1, full):
+        if mask & (mask - 1) == 0:
+            continue  # single city, already initialized
+        row = mask * m
+        for j in range(m):
+            if not mask >> j & 1:
+                continue
+            prev = (mask ^ (1 << j)) * m
+            best, arg = math.inf, -1
+            for k in range(m):
+                value = dist[prev + k]
+                if value < math.inf:
+                    value += matrix[k + 1][j + 1]
+                    if value < best:
+                        best, arg = value, k
+            dist[row + j] = best
+            parent[row + j] = arg
+
+    row = (full - 1) * m
+    last = min(range(m), key=lambda j: dist[row + j] + matrix[j + 1][0])
+    length = dist[row + last] + matrix[last + 1][0]
+    path = [0]
+    mask = full - 1
+    while last >= 0:
+        path.append(last + 1)
+        mask, last = mask ^ (1 << last), parent[mask * m + last]
+    path.append(0)
+    path[1:-1] = path[-2:0:-1]
+    return path, length
+
+
+def held_karp(
+    matrix: Sequence[Sequence[float]],
+    max_bytes: int = HELD_KARP_MAX_BYTES,
+    ) -> tuple[list[int], float]:
+    """Exact TSP by Held-Karp bitmask DP in O(n^2 2^n) time.
+
+    Uses NumPy when available and flat ``array`` tables otherwise. Raises
+    ``MemoryError`` when ``held_karp_memory(n)`` exceeds ``max_bytes``.
+    """
+    n = len(matrix)
+    if n <= 2:  # noqa: PLR2004
+        path = [*range(n), 0] if n else []
+        return path, tour_length(matrix, path) if n else 0
+    needed = held_karp_memory(n)
+    if needed > max_bytes:
+        msg = (
+            f"Held-Karp sur {n} villes demande {needed / 2**20:.0f} Mio "
+            f"(limite {max_bytes / 2**20:.0f} Mio)."
+        )
+        raise MemoryError(msg)
+    if np is not None:
+        return _held_karp_numpy(matrix)
+    return _held_karp_arrays(matrix)
+
+
+def _spanning_bound(cost: list[list[float]], nodes: list[int]) -> float:
+    """Weight of a minimum spanning tree over ``nodes`` (Prim, O(k^2))."""
+    if len(nodes) < 2:  # noqa: PLR2004
+        return 0.0
+    first = cost[nodes[0]]
+    rest = nodes[1:]
+    key = [first[v] for v in rest]
+    total = 0.0
+    while rest:
+        i = min(range(len(rest)), key=key.__getitem__)
+        total += key[i]
+        u = rest[i]
+        rest[i] = rest[-1]
+        key[i] = key[-1]
+        rest.pop()
+        key.pop()
+        row = cost[u]
+        for k, v in enumerate(rest):
+            key[k] = min(key[k], row[v])
+    return total
+
+
+def branch_and_bound(
+    matrix: Sequence[Sequence[float]],
+    initial: tuple[list[int], float] | None = None,
+    ) -> tuple[list[int], float]:
+    """Exact TSP by depth-first branch-and-bound.
+
+    A partial tour ending at ``u`` still needs a path from ``u`` through every
+    unvisited city back to 0. Under ``min(d[a][b], d[b][a])`` that path costs
+    at least the cheapest edge out of ``u``, a minimum spanning tree of the
+    unvisited cities and the cheapest edge back to 0.
+    Children are explored nearest first, so the first complete tour is the
+    nearest-neighbor tour and serves as the initial upper bound unless a
+    better ``initial`` ``(path, length)`` is given.
+    """
+    n = len(matrix)
+    if n <= 2:  # noqa: PLR2004
+        return held_karp(matrix)
+    cost = [[min(matrix[a][b], matrix[b][a]) for b in range(n)] for a in range(n)]
+    best_path, best = initial if initial is not None else ([], math.inf)
+    best_path = list(best_path)
+    path = [0]
+    unvisited = set(range(1, n))
+
+    def search(u: int, length: float) -> None:
+        nonlocal best, best_path
+        if not unvisited:
+            total = length + matrix[u][0]
+            if total < best:
+                best, best_path = total, [*path, 0]
+            return
+        remaining = list(unvisited)
+        bound = (
+            length
+            + min(cost[u][v] for v in remaining)
+            + _spanning_bound(cost, remaining)
+            + min(cost[v][0] for v in remaining)
+        )
+        if bound >= best:
+            return
+        row = matrix[u]
+        for v in sorted(unvisited, key=row.__getitem__):
+            extended = length + row[v]
+            if extended >= best:
+                break
+            unvisited.remove(v)
+            path.append(v)
+            search(v, extended)
+            path.pop()
+            unvisited.add(v)
+
+    search(0, 0)
+    return best_path, best
@@ -0,0 +1,383 @@
+"""Nearest-neighbor construction improved by 2-opt and Or-opt local search."""
+from __future__ import annotations
+
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+CANDIDATES = 8
+OR_OPT_MAX_SEGMENT = 3
+KNN_CHUNK = 512
+EPSILON = 1e-9
+
+
+class TSPInstance:
+    """Symmetric TSP given by a distance matrix or by 2D points.
+
+    Point instances never build the n x n matrix, so they scale to tens of
+    thousands of cities; distances are Euclidean and computed on demand.
+    """
+
+    __slots__ = ("rows", "xs", "ys")
+
+    def __init__(
+        self,
+        rows: list[list[float]] | None = None,
+        xs: list[float] | None = None,
+        ys: list[float] | None = None,
+        ) -> None:
+        """Initialize from matrix rows or from point coordinates."""
+        self.rows = rows
+        self.xs = xs
+        self.ys = ys
+
+    @classmethod
+    def from_matrix(cls, matrix: Sequence[Sequence[float]]) -> TSPInstance:
+        """Build an instance from a (symmetric) distance matrix."""
+        return cls(rows=[list(row) for row in matrix])
+
+    @classmethod
+    def from_points(cls, points: Iterable[tuple[float, float]]) -> TSPInstance:
+        """Build an instance from ``(x, y)`` points."""
+        xs, ys = [], []
+        for x, y in points:
+            xs.append(float(x))
+            ys.append(float(y))
+        return cls(xs=xs, ys=ys)
+
+    def __len__(self) -> int:
+        """Return the number of cities."""
+        return len(self.rows) if self.rows is not None else len(self.xs)
+
+    def distance(self, a: int, b: int) -> float:
+        """Return the distance between cities ``a`` and ``b``."""
+        if self.rows is not None:
+            return self.rows[a][b]
+        return math.hypot(self.xs[a] - self.xs[b], self.ys[a] - self.ys[b])
+
+    def tour_length(self, path: Sequence[int]) -> float:
+        """Return the length of a closed path ``[s, ..., s]``."""
+        return sum(self.distance(path[i], path[i + 1]) for i in range(len(path) - 1))
+
+
+def nearest_neighbor_tour(
+    instance: TSPInstance,
+    start: int = 0,
+    ) -> tuple[list[int], float]:
+    """Greedy nearest-neighbor tour, each step vectorized with NumPy if available."""
+    n = len(instance)
+    path = [start]
+    if np is None:
+        visited = [False] * n
+        visited[start] = True
+        current = start
+        for _ in range(n - 1):
+            current = min(
+                (i for i in range(n) if not visited[i]),
+                key=lambda i, u=current: instance.distance(u, i),
+            )
+            visited[current] = True
+            path.append(current)
+    elif instance.rows is not None:
+        matrix = np.asarray(instance.rows, dtype=np.float64)
+        blocked = np.zeros(n, dtype=bool)
+        blocked[start] = True
+        current = start
+        for _ in range(n - 1):
+            row = matrix[current].copy()
+            row[blocked] = np.inf
+            current = int(row.argmin())
+            blocked[current] = True
+            path.append(current)
+    else:
+        # Unvisited cities are kept packed in the first ``size`` slots, so
+        # each step only scans what is left; squared distances keep the order.
+        ids = np.arange(n)
+        xs, ys = np.asarray(instance.xs), np.asarray(instance.ys)
+        x, y = xs[start], ys[start]
+        size = n - 1
+        ids[start], ids[size] = ids[size], ids[start]
+        xs, ys = xs[ids], ys[ids]
+        for _ in range(n - 1):
+            i = int(((xs[:size] - x) ** 2 + (ys[:size] - y) ** 2).argmin())
+            path.append(int(ids[i]))
+            x, y = xs[i], ys[i]
+            size -= 1
+            ids[i], xs[i], ys[i] = ids[size], xs[size], ys[size]
+    path.append(start)
+    return path, instance.tour_length(path)
+
+
+def candidate_lists(instance: TSPInstance, k: int = CANDIDATES) -> list[list[int]]:
+    """Return the ``k`` nearest other cities of every city, nearest first."""
+    n = len(instance)
+    k = min(k, n - 1)
+    if k <= 0:
+        return [[] for _ in range(n)]
+    if np is None:
+        return [
+            sorted(
+                (b for b in range(n) if b != a),
+                key=lambda b, a=a: instance.distance(a, b),
+            )[:k]
+            for a in range(n)
+        ]
+
+    if instance.rows is not None:
+        matrix = np.asarray(instance.rows, dtype=np.float64)
+    else:
+        xs, ys = np.asarray(instance.xs), np.asarray(instance.ys)
+    result = []
+    for lo in range(0, n, KNN_CHUNK):
+        hi = min(n, lo + KNN_CHUNK)
+        if instance.rows is not None:
+            block = matrix[lo:hi].copy()
+        else:
+            block = (xs[lo:hi, None] - xs) ** 2 + (ys[lo:hi, None] - ys) ** 2
+        block[np.arange(hi - lo), np.arange(lo, hi)] = np.inf
+        nearest = np.argpartition(block, k - 1, axis=1)[:, :k]
+        order = np.take_along_axis(block, nearest, axis=1).argsort(axis=1)
+        result.extend(np.take_along_axis(nearest, order, axis=1).tolist())
+    return result
+
+
+class _TourSearch:
+    """Tour under local search, with city positions and don't-look bits.
+
+    ``tour`` is the open cyclic order of the cities and is modified in place.
+    """
+
+    __slots__ = ("active", "dist", "n", "neighbors", "pos", "queued", "tour")
+
+    def __init__(
+        self,
+        instance: TSPInstance,
+        tour: list[int],
+        neighbors: list[list[int]],
+        ) -> None:
+        """Index the positions of ``tour`` and queue every city."""
+        self.tour = tour
+        self.neighbors = neighbors
+        self.dist = instance.distance
+        self.n = n = len(tour)
+        self.pos = [0] * n
+        for i, city in enumerate(tour):
+            self.pos[city] = i
+        self.active = deque(tour)
+        self.queued = bytearray([1]) * n
+
+    def succ(self, city: int) -> int:
+        """Return the city after ``city`` in the tour."""
+        return self.tour[self.pos[city] + 1 - self.n]
+
+    def pred(self, city: int) -> int:
+        """Return the city before ``city`` in the tour."""
+        return self.tour[self.pos[city] - 1]
+
+    def reverse(self, i: int, j: int) -> None:
+        """Reverse the cyclic slice ``i..j``, or its complement if shorter."""
+        tour, pos, n = self.tour, self.pos, self.n
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+        for _ in range(length // 2):
+            a, b = tour[i], tour[j]
+            tour[i] = b
+            pos[b] = i
+            tour[j] = a
+            pos[a] = j
+            i = i + 1 if i + 1 < n else 0
+            j = j - 1 if j > 0 else n - 1
+
+    def exchange(self, a: int, b: int, c: int, d: int) -> None:
+        """Replace edges ``a-b`` and ``c-d`` by ``a-c`` and ``b-d``.
+
+        ``b`` follows ``a`` in the same direction as ``d`` follows ``c``.
+        """
+        pos = self.pos
+        if self.succ(a) == b:
+            self.reverse(pos[b], pos[c])
+        else:
+            self.reverse(pos[a], pos[d])
+
+    def wake(self, *cities: int) -> None:
+        """Clear the don't-look bits of ``cities``."""
+        for city in cities:
+            if not self.queued[city]:
+                self.queued[city] = 1
+                self.active.append(city)
+
+    def two_opt_move(self, a: int) -> bool:
+        """Apply the first improving 2-opt move removing an edge at ``a``."""
+        dist, neighbors = self.dist, self.neighbors
+        for step in (self.succ, self.pred):
+            b = step(a)
+            d_ab = dist(a, b)
+            for c in neighbors[a]:
+                d_ac = dist(a, c)
+                if d_ac >= d_ab:
+                    break
+                d = step(c)
+                if c == b or d == a:
+                    continue
+                if d_ac + dist(b, d) - d_ab - dist(c, d) < -EPSILON:
+                    self.exchange(a, b, c, d)
+                    self.wake(a, b, c, d)
+                    return True
+        return False
+
+    def or_opt_move(self, s1: int) -> bool:
+        """Move the first segment starting at ``s1`` that gains by relocation."""
+        s0 = self.pred(s1)
+        s2 = s1
+        segment = [s1]
+        for _ in range(OR_OPT_MAX_SEGMENT):
+            s3 = self.succ(s2)
+            if s3 == s0 or len(segment) + 3 > self.n:
+                return False
+            if self._insert_segment(s0, s1, s2, s3, segment):
+                return True
+            s2 = s3
+            segment.append(s2)
+        return False
+
+    def _insert_segment(
+        self,
+        s0: int,
+        s1: int,
+        s2: int,
+        s3: int,
+        segment: list[int],
+        ) -> bool:
+        """Move ``s1..s2`` between ``s0`` and ``s3`` into a cheaper tour edge."""
+        dist = self.dist
+        removal = dist(s0, s1) + dist(s2, s3) - dist(s0, s3)
+        if removal <= EPSILON:
+            return False
+        for end in (s1, s2) if s1 != s2 else (s1,):
+            for c in self.neighbors[end]:
+                if dist(end, c) >= removal:
+                    break
+                for p, q in ((c, self.succ(c)), (self.pred(c), c)):
+                    if p in segment or q in segment or q == s0:
+                        continue
+                    base = dist(p, q)
+                    forward = dist(p, s1) + dist(s2, q) - base
+                    backward = dist(p, s2) + dist(s1, q) - base
+                    if min(forward, backward) < removal - EPSILON:
+                        # Reversing s1..p lays the segment, flipped, before q;
+                        # reversing p..s3 back restores the rest of the tour.
+                        # A last reversal restores its order when that is cheaper.
+                        self.exchange(s0, s1, p, q)
+                        if p != s3:
+                            self.exchange(s0, p, s3, s2)
+                        if forward < backward and s1 != s2:
+                            self.exchange(p, s2, s1, q)
+                        self.wake(s0, s1, s2, s3, p, q)
+                        return True
+        return False
+
+
+def _local_search(
+    instance: TSPInstance,
+    tour: list[int],
+    neighbors: list[list[int]],
+    *,
+    or_opt: bool,
+    ) -> list[int]:
+    """Run 2-opt and Or-opt moves driven by don't-look bits until no gain remains.
+
+    ``tour`` is the open cyclic order of the cities; it is modified in place.
+    """
+    search = _TourSearch(instance, tour, neighbors)
+    active, queued = search.active, search.queued
+    while active:
+        city = active.popleft()
+        queued[city] = 0
+        if search.two_opt_move(city) or (or_opt and search.or_opt_move(city)):
+            search.wake(city)
+    return tour
+
+
+def improve_tour(
+    instance: TSPInstance,
+    path: Sequence[int],
+    k: int = CANDIDATES,
+    *,
+    or_opt: bool = True,
+    neighbors: list[list[int]] | None = None,
+    ) -> tuple[list[int], float]:
+    """Improve a closed tour ``[s, ..., s]`` with 2-opt and Or-opt.
+
+    Moves are only searched among the ``k`` nearest neighbors of each city,
+    and a city is re-examined only after one of its tour edges changed
+    (don't-look bits). Returns the improved ``(path, length)`` starting at
+    the same city.
+    """
+    tour = list(path[:-1])
+    if len(tour) < 5:  # noqa: PLR2004
+        return list(path), instance.tour_length(path)
+    if neighbors is None:
+        neighbors = candidate_lists(instance, k)
+    _local_search(instance, tour, neighbors, or_opt=or_opt)
+    start = tour.index(path[0])
+    improved = [*tour[start:], *tour[:start], path[0]]
+    return improved, instance.tour_length(improved)
+
+
+_worker_instance: TSPInstance | None = None
+_worker_neighbors: list[list[int]] = []
+
+
+def _init_worker(instance: TSPInstance, neighbors: list[list[int]]) -> None:
+    """Store the instance and its candidate lists once per worker process."""
+    global _worker_instance, _worker_neighbors  # noqa: PLW0603
+    _worker_instance = instance
+    _worker_neighbors = neighbors
+
+
+def _improve_from(start: int) -> tuple[list[int], float]:
+    """Worker: nearest-neighbor tour from ``start``, then local search."""
+    path, _ = nearest_neighbor_tour(_worker_instance, start)
+    return improve_tour(_worker_instance, path, neighbors=_worker_neighbors)
+
+
+def multi_start(
+    instance: TSPInstance,
+    starts: Iterable[int] = (0,),
+    k: int = CANDIDATES,
+    max_workers: int | None = None,
+    ) -> tuple[list[int], float]:
+    """Best improved tour over several nearest-neighbor start cities.
+
+    Starts are spread over a process pool; ``max_workers=1`` stays in-process.
+    The returned tour is rotated to begin and end at city 0.
+    """
+    starts = list(starts)
+    neighbors = candidate_lists(instance, k)
+    if max_workers == 1 or len(starts) == 1:
+        _init_worker(instance, neighbors)
+        results = list(map(_improve_from, starts))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count() or 1,
+            initializer=_init_worker,
+            initargs=(instance, neighbors),
+        ) as executor:
+            results = list(executor.map(_improve_from, starts))
+
+    path, length = min(results, key=lambda result: result[1])
+    tour = path[:-1]
+    start = tour.index(0)
+    return [*tour[start:], *tour[:start], 0], length
@@ -0,0 +1,148 @@
+"""Parallel exhaustive TSP search split by tour prefixes."""
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Value
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from multiprocessing.sharedctypes import Synchronized
+
+PREFIXES_PER_WORKER = 8
+REFRESH_INTERVAL = 4096
+
+_worker_matrix: list[list[float]] = []
+_worker_nearest: list[list[int]] = []
+_worker_symmetric = False
+_worker_best: Synchronized | None = None
+
+
+def _init_worker(
+    matrix: list[list[float]],
+    symmetric: bool,  # noqa: FBT001
+    best: Synchronized,
+    ) -> None:
+    """Store the matrix and the shared best length once per worker process."""
+    global _worker_matrix, _worker_nearest  # noqa: PLW0603
+    global _worker_symmetric, _worker_best  # noqa: PLW0603
+    _worker_matrix = matrix
+    _worker_nearest = [
+        sorted(range(1, len(matrix)), key=row.__getitem__) for row in matrix
+    ]
+    _worker_symmetric = symmetric
+    _worker_best = best
+
+
+def _publish(length: float) -> float:
+    """Lower the shared best length to ``length`` if it improves it; return it."""
+    with _worker_best.get_lock():
+        _worker_best.value = min(_worker_best.value, length)
+        return _worker_best.value
+
+
+def _search_prefix(prefix: tuple[int, ...]) -> tuple[list[int], float]:
+    """Worker: best tour starting with ``prefix``, or ``([], inf)`` if pruned."""
+    matrix = _worker_matrix
+    nearest = _worker_nearest
+    symmetric = _worker_symmetric
+    n = len(matrix)
+    length = sum(matrix[prefix[i]][prefix[i + 1]] for i in range(len(prefix) - 1))
+    best = _worker_best.value
+    if length >= best:
+        return [], math.inf
+
+    path = list(prefix)
+    visited = [False] * n
+    for city in prefix:
+        visited[city] = True
+    found: list[int] = []
+    found_length = math.inf
+    nodes = 0
+
+    def extend(u: int, length: float) -> None:
+        nonlocal best, found, found_length, nodes
+        nodes += 1
+        if nodes % REFRESH_INTERVAL == 0:
+            best = min(best, _worker_best.value)
+        if len(path) == n:
+            total = length + matrix[u][0]
+            if total < best:
+                found, found_length = [*path, 0], total
+                best = _publish(total)
+            return
+        row = matrix[u]
+        for v in nearest[u]:
+            # Reversal symmetry: keep only the twin visiting city 1 before city 2.
+            if visited[v] or (symmetric and v == 2 and not visited[1]):  # noqa: PLR2004
+                continue
+            extended = length + row[v]
+            if extended >= best:
+                break
+            visited[v] = True
+            path.append(v)
+            extend(v, extended)
+            path.pop()
+            visited[v] = False
+
+    extend(path[-1], length)
+    return found, found_length
+
+
+def _prefixes(n: int, count: int, *, symmetric: bool) -> list[tuple[int, ...]]:
+    """Expand tour prefixes breadth-first until there are at least ``count``."""
+    prefixes = [(0,)]
+    while len(prefixes) < count and len(prefixes[0]) < n - 1:
+        prefixes = [
+            (*prefix, v)
+            for prefix in prefixes
+            for v in range(1, n)
+            if v not in prefix
+            and not (symmetric and v == 2 and 1 not in prefix)  # noqa: PLR2004
+        ]
+    return prefixes
+
+
+def parallel_brute_force(
+    matrix: Sequence[Sequence[float]],
+    max_workers: int | None = None,
+    initial: tuple[list[int], float] | None = None,
+    ) -> tuple[list[int], float]:
+    """Exact TSP by exhaustive search spread over a process pool.
+
+    Tours are split by fixed prefixes starting at city 0. Each worker extends
+    its prefixes depth first with incremental lengths, visiting the nearest
+    cities first, and prunes any partial tour already as long as the best
+    one, which is shared between workers. On symmetric matrices only tours
+    visiting city 1 before city 2 are explored, since every tour has a
+    reversed twin of the same length. ``initial`` is an optional known
+    ``(path, length)`` upper bound; ``max_workers=1`` stays in-process.
+    """
+    n = len(matrix)
+    matrix = [list(row) for row in matrix]
+    if n <= 2:  # noqa: PLR2004
+        path = [*range(n), 0] if n else []
+        return path, sum(matrix[path[i]][path[i + 1]] for i in range(len(path) - 1))
+    symmetric = all(matrix[a][b] == matrix[b][a] for a in range(n) for b in range(a))
+    best_path, best_length = initial if initial is not None else ([], math.inf)
+    best = Value("d", best_length)
+
+    workers = max_workers or os.cpu_count() or 1
+    prefixes = _prefixes(n, PREFIXES_PER_WORKER * workers, symmetric=symmetric)
+    if workers == 1:
+        _init_worker(matrix, symmetric, best)
+        results = map(_search_prefix, prefixes)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(matrix, symmetric, best),
+        ) as executor:
+            results = list(executor.map(_search_prefix, prefixes))
+
+    for path, length in results:
+        if length < best_length:
+            best_path, best_length = path, length
+    return list(best_path), best_length
@@ -0,0 +1,173 @@
+"""Compact graph representation shared by the graph exercises."""
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+class CSRGraph:
+    """Directed graph stored in compressed sparse row (CSR) form.
+
+    Node names are interned to integer ids ``0..n-1``. The out-edges of node
+    ``u`` are the slots ``offsets[u]:offsets[u + 1]`` of ``targets``,
+    ``weights`` and ``capacities``.
+    """
+
+    __slots__ = ("capacities", "index", "names", "offsets", "targets", "weights")
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        offsets: array,
+        targets: array,
+        weights: array | None = None,
+        capacities: array | None = None,
+        ) -> None:
+        """Initialize a CSR graph from already built buffers."""
+        self.names: list[str] = list(names)
+        self.index: dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.capacities = capacities
+
+    @classmethod
+    def from_edges(
+        cls,
+        names: Sequence[str],
+        edges: Iterable[tuple[int, int, float, int]],
+        ) -> CSRGraph:
+        """Build a graph from ``(u, v, weight, capacity)`` id tuples."""
+        n = len(names)
+        sources = array("i")
+        targets = array("i")
+        weights = array("d")
+        capacities = array("q")
+        counts = [0] * (n + 1)
+        for u, v, w, c in edges:
+            sources.append(u)
+            targets.append(v)
+            weights.append(w)
+            capacities.append(c)
+            counts[u + 1] += 1
+
+        offsets = array("q", counts)
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+
+        # Counting sort of the edges by source, stable within each source.
+        m = len(targets)
+        cursor = array("q", offsets[:n])
+        sorted_targets = array("i", bytes(4 * m))
+        sorted_weights = array("d", bytes(8 * m))
+        sorted_capacities = array("q", bytes(8 * m))
+        for e in range(m):
+            u = sources[e]
+            slot = cursor[u]
+            cursor[u] = slot + 1
+            sorted_targets[slot] = targets[e]
+            sorted_weights[slot] = weights[e]
+            sorted_capacities[slot] = capacities[e]
+
+        return cls(names, offsets, sorted_targets, sorted_weights, sorted_capacities)
+
+    @classmethod
+    def from_adjacency(cls, graph: Mapping[str, Iterable[str]]) -> CSRGraph:
+        """Build a graph from an unweighted ``{node: [neighbor, ...]}`` mapping."""
+        names = _intern(graph, (v for neighbors in graph.values() for v in neighbors))
+        index = {name: i for i, name in enumerate(names)}
+        edges = (
+            (index[u], index[v], 1.0, 1)
+            for u, neighbors in graph.items()
+            for v in neighbors
+        )
+        return cls.from_edges(names, edges)
+
+    @classmethod
+    def from_weighted(
+        cls,
+        graph: Mapping[str, Iterable[Sequence[Any]]],
+        ) -> CSRGraph:
+        """Build a graph from a ``{node: [(neighbor, weight), ...]}`` mapping."""
+        names = _intern(graph, (v for edges in graph.values() for v, _ in edges))
+        index = {name: i for i, name in enumerate(names)}
+        edges = (
+            (index[u], index[v], w, 0)
+            for u, out in graph.items()
+            for v, w in out
+        )
+        return cls.from_edges(names, edges)
+
+    @classmethod
+    def from_capacity(cls, graph: Mapping[str, Mapping[str, int]]) -> CSRGraph:
+        """Build a graph from a ``{node: {neighbor: capacity}}`` mapping."""
+        names = _intern(graph, (v for out in graph.values() for v in out))
+        index = {name: i for i, name in enumerate(names)}
+        edges = (
+            (index[u], index[v], 1.0, c)
+            for u, out in graph.items()
+            for v, c in out.items()
+        )
+        return cls.from_edges(names, edges)
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes in the graph."""
+        return len(self.names)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of directed edges in the graph."""
+        return len(self.targets)
+
+    def node_id(self, name: str) -> int:
+        """Return the integer id of a node name."""
+        return self.index[name]
+
+    def out_edges(self, u: int) -> range:
+        """Return the edge slots leaving node ``u``."""
+        return range(self.offsets[u], self.offsets[u + 1])
+
+    def neighbors(self, u: int) -> array:
+        """Return the targets of the edges leaving node ``u``."""
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def nbytes(self) -> int:
+        """Return the memory used by the CSR buffers, in bytes."""
+        buffers = (self.offsets, self.targets, self.weights, self.capacities)
+        return sum(b.itemsize * len(b) for b in buffers if b is not None)
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Return zero-copy NumPy views over the CSR buffers."""
+        if np is None:
+            msg = "NumPy est requis pour to_numpy()."
+            raise ImportError(msg)
+        views = {"offsets": self.offsets, "targets": self.targets}
+        if self.weights is not None:
+            views["weights"] = self.weights
+        if self.capacities is not None:
+            views["capacities"] = self.capacities
+        return {
+            key: np.frombuffer(buf, dtype=buf.typecode) for key, buf in views.items()
+        }
+
+    def translate(self, values: Sequence[Any]) -> dict[str, Any]:
+        """Map a per-node sequence indexed by id back to node names."""
+        return dict(zip(self.names, values, strict=True))
+
+
+def _intern(graph: Mapping[str, Any], targets: Iterable[str]) -> list[str]:
+    """Return node names in first-seen order, keys first then edge targets."""
+    names = dict.fromkeys(graph)
+    for v in targets:
+        if v not in names:
+            names[v] = None
+    return list(names)
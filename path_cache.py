@@ -0,0 +1,187 @@
+"""Cache of shortest-path trees for Dijkstra and Bellman-Ford."""
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable
+
+from ex2.code import dijkstra
+from ex2.priority_queues import queue_factory
+from ex3.code import bellman_ford
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from ex2.priority_queues import PriorityQueue
+
+ShortestPathTree = tuple[
+    "Mapping[str, float] | None",
+    "Mapping[str, str | None] | None",
+]
+
+ALGORITHMS: dict[str, Callable[..., ShortestPathTree]] = {
+    "dijkstra": dijkstra,
+    "bellman_ford": bellman_ford,
+}
+
+
+class VersionedGraph:
+    """Weighted adjacency graph whose version is bumped on every mutation."""
+
+    def __init__(
+        self,
+        graph: dict[str, Iterable[Sequence]] | None = None,
+        ) -> None:
+        """Copy ``graph`` (``{node: [(neighbor, weight), ...]}``) into a new graph."""
+        self.adjacency: dict[str, list[tuple[str, float]]] = {}
+        self.version = 0
+        for node, edges in (graph or {}).items():
+            self.add_node(node)
+            for neighbor, weight in edges:
+                self.add_node(neighbor)
+                self.adjacency[node].append((neighbor, weight))
+
+    def add_node(self, node: str) -> None:
+        """Add an isolated node if it does not exist yet."""
+        if node not in self.adjacency:
+            self.adjacency[node] = []
+            self.version += 1
+
+    def add_edge(self, u: str, v: str, weight: float) -> None:
+        """Add the edge ``u -> v``."""
+        self.add_node(u)
+        self.add_node(v)
+        self.adjacency[u].append((v, weight))
+        self.version += 1
+
+    def remove_edge(self, u: str, v: str) -> None:
+        """Remove every edge ``u -> v``."""
+        edges = self.adjacency.get(u, [])
+        kept = [(neighbor, w) for neighbor, w in edges if neighbor != v]
+        if len(kept) == len(edges):
+            msg = f"Arête inexistante : {u} -> {v}"
+            raise KeyError(msg)
+        self.adjacency[u] = kept
+        self.version += 1
+
+    def set_weight(self, u: str, v: str, weight: float) -> None:
+        """Reweight every edge ``u -> v``."""
+        edges = self.adjacency.get(u, [])
+        if all(neighbor != v for neighbor, _ in edges):
+            msg = f"Arête inexistante : {u} -> {v}"
+            raise KeyError(msg)
+        self.adjacency[u] = [
+            (neighbor, weight if neighbor == v else w) for neighbor, w in edges
+        ]
+        self.version += 1
+
+
+def _mapping_size(part: dict | None) -> int:
+    """Approximate bytes held by a tree dict: the table plus its values."""
+    if part is None:
+        return 0
+    return sys.getsizeof(part) + sum(sys.getsizeof(value) for value in part.values())
+
+
+class ShortestPathCache:
+    """LRU cache of shortest-path trees bounded by an approximate memory budget.
+
+    Entries are keyed by ``(graph version, source, algorithm)`` and the whole
+    cache is dropped as soon as the graph version changes.
+    """
+
+    def __init__(self, graph: VersionedGraph, max_bytes: int = 64 * 2**20) -> None:
+        """Initialize an empty cache over ``graph``."""
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[
+            tuple[int, str, str],
+            tuple[ShortestPathTree, int],
+        ] = OrderedDict()
+        self._version = graph.version
+        self._queue: Callable[[], PriorityQueue] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of cached trees."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached tree."""
+        self._entries.clear()
+        self.used_bytes = 0
+
+    def tree(self, source: str, algorithm: str = "dijkstra") -> ShortestPathTree:
+        """Return the ``(dist, parent)`` tree from ``source``, computed on a miss.
+
+        The mappings are read-only views of the cached tree, whose size is
+        charged to ``used_bytes``:
+
+        >>> graph = VersionedGraph({str(i): [(str(i + 1), 1.0)] for i in range(9999)})
+        >>> cache = ShortestPathCache(graph)
+        >>> dist, parent = cache.tree("0")
+        >>> tables = sys.getsizeof(dict(dist)) + sys.getsizeof(dict(parent))
+        >>> values = [*dist.values(), *parent.values()]
+        >>> cache.used_bytes >= tables + sum(map(sys.getsizeof, values))
+        True
+        """
+        if self.graph.version != self._version:
+            self.clear()
+            self._version = self.graph.version
+            self._queue = None
+
+        key = (self._version, source, algorithm)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+        self.misses += 1
+        tree = self._search(source, algorithm)
+        size = sum(_mapping_size(part) for part in tree)
+        result = tuple(
+            None if part is None else MappingProxyType(part) for part in tree
+        )
+        if size <= self.max_bytes:
+            self._entries[key] = (result, size)
+            self.used_bytes += size
+            while self.used_bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.used_bytes -= evicted
+        return result
+
+    def _search(self, source: str, algorithm: str) -> ShortestPathTree:
+        """Run ``algorithm`` from ``source``, Dijkstra with a queue picked once."""
+        search = ALGORITHMS[algorithm]
+        if search is not dijkstra:
+            return search(self.graph.adjacency, source)
+        if self._queue is None:
+            self._queue = queue_factory(self.graph.adjacency)
+        return dijkstra(self.graph.adjacency, source, queue=self._queue())
+
+    def distance(
+        self,
+        source: str,
+        target: str,
+        algorithm: str = "dijkstra",
+        ) -> float | None:
+        """Return the shortest distance, ``None`` on a negative cycle."""
+        dist, _ = self.tree(source, algorithm)
+        return None if dist is None else dist[target]
+
+    def path(self, source: str, target: str, algorithm: str = "dijkstra") -> list[str]:
+        """Return the shortest path in O(path length) once the tree is cached."""
+        dist, parent = self.tree(source, algorithm)
+        if dist is None or parent is None or dist[target] == float("inf"):
+            return []
+        path = []
+        node = target
+        while node is not None:
+            path.append(node)
+            node = parent[node]
+        path.reverse()
+        return path